@@ -11,7 +11,8 @@
 
 # -*- coding: utf-8 -*-
 """pysui package."""
-import sys
+
+import importlib
 import logging
 from pysui.version import __version__
 
@@ -21,23 +22,45 @@ if not logging.getLogger().handlers:
     logger.propagate = False
 
 logger.info("Initializing pysui")
-if sys.version_info < (3, 10):
-    raise EnvironmentError("Python 3.10 or above is required")
-
-# Convenience imports
-
-from pysui.sui.sui_types.address import SuiAddress
-from pysui.sui.sui_types.scalars import ObjectID
-from pysui.sui.sui_config import SuiConfig
-from pysui.sui.sui_clients.common import (
-    PreExecutionResult,
-    SuiRpcResult,
-    handle_result,
-)
-from pysui.sui.sui_clients.sync_client import SuiClient as SyncClient
-from pysui.sui.sui_clients.async_client import SuiConfig as AsyncClient
-from pysui.sui.sui_clients.transaction import (
-    SuiTransaction as SyncTransaction,
-    SuiTransactionAsync as AsyncTransaction,
-    SigningMultiSig,
-)
+
+# Convenience imports, resolved on first access (PEP 562) as
+# exported name: (module, name in module)
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "SuiAddress": ("pysui.sui.sui_types.address", "SuiAddress"),
+    "ObjectID": ("pysui.sui.sui_types.scalars", "ObjectID"),
+    "SuiConfig": ("pysui.sui.sui_config", "SuiConfig"),
+    "PreExecutionResult": (
+        "pysui.sui.sui_clients.common",
+        "PreExecutionResult",
+    ),
+    "SuiRpcResult": ("pysui.sui.sui_clients.common", "SuiRpcResult"),
+    "handle_result": ("pysui.sui.sui_clients.common", "handle_result"),
+    "SyncClient": ("pysui.sui.sui_clients.sync_client", "SuiClient"),
+    "AsyncClient": ("pysui.sui.sui_clients.async_client", "SuiClient"),
+    "SyncTransaction": ("pysui.sui.sui_clients.transaction", "SuiTransaction"),
+    "AsyncTransaction": (
+        "pysui.sui.sui_clients.transaction",
+        "SuiTransactionAsync",
+    ),
+    "SigningMultiSig": (
+        "pysui.sui.sui_clients.transaction",
+        "SigningMultiSig",
+    ),
+}
+
+__all__ = ["__version__", *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    """Import a convenience name on first access."""
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(target[0]), target[1])
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include convenience names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
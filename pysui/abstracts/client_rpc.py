@@ -70,6 +70,8 @@ class Builder(ABC):
 class RpcResult(ABC):
     """Rpc Result for call returns."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Initialize Result."""
 
@@ -12,12 +12,42 @@
 # -*- coding: utf-8 -*-
 
 
-"""Main pysui package. Contains imports of various module types."""
+"""Main pysui package. Contains imports of various module types.
 
+Names other than the constants are imported on first access (PEP 562), so
+importing a ``pysui.sui`` submodule does not load the crypto, config and
+API descriptor modules.
+"""
 
+import importlib
+from pysui.sui import sui_constants
 from pysui.sui.sui_constants import *
 from pysui.sui.sui_excepts import SuiInvalidAddress
-from pysui.sui.sui_apidesc import SuiApi, build_api_descriptors
-from pysui.sui.sui_config import SuiConfig
-from pysui.sui.sui_crypto import keypair_from_keystring
-from pysui.sui.sui_txn_validator import validate_api
+
+# Lazily imported names and their modules
+_LAZY_IMPORTS: dict[str, str] = {
+    "SuiApi": "pysui.sui.sui_apidesc",
+    "build_api_descriptors": "pysui.sui.sui_apidesc",
+    "SuiConfig": "pysui.sui.sui_config",
+    "keypair_from_keystring": "pysui.sui.sui_crypto",
+    "validate_api": "pysui.sui.sui_txn_validator",
+}
+
+__all__ = [
+    name for name in vars(sui_constants) if not name.startswith("_")
+] + ["SuiInvalidAddress", *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    """Import a lazily exported name on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily exported names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -114,6 +114,16 @@ class SuiBaseBuilder(Builder):
         self._handler_cls: Type[SuiBaseType] = handler_cls
         self._handler_func: str = handler_func
 
+    def __setattr__(self, name: str, value) -> None:
+        """Drop any cached RPC data block when a public (parameter) attribute changes.
+
+        Only assignment is seen, changes made in place to a parameter's
+        contents (e.g. appending to a SuiArray or SuiMap) are not.
+        """
+        if name[0] != "_":
+            self.__dict__.pop("_envelope_cache", None)
+        object.__setattr__(self, name, value)
+
     @versionchanged(version="0.24.0", reason="Moved from list to dict for RPC params")
     def _pull_vars(self) -> dict:
         """Filter out private/protected var elements."""
@@ -225,6 +235,8 @@ def sui_builder(*includes, **kwargs):
         # handle varargs is an exception for builders
         if spec.varargs:
             raise AttributeError(f"Builder initializers do not accept variable args {spec.varargs}")
+        # Classes the builder properties have been installed on
+        __property_classes: set = set()
 
         def sieve(attr: str) -> bool:
             """sieve Checks if attribute should be included in results.
@@ -252,18 +264,41 @@ def sui_builder(*includes, **kwargs):
                 return get_args(anno)[0]
             return anno
 
+        # Argument names are static per builder
+        __arg_names = spec.kwonlyargs if spec.kwonlyargs else spec.args[1:]
+
         def track_map() -> dict:
             """track_map Setup the mapping of arguments and types.
 
             :return: Dict of arg_name and none
             :rtype: dict
             """
-            if spec.kwonlyargs:
-                var_map: dict = {x: None for x in spec.kwonlyargs}
-            else:
-                var_map: dict = {x: None for x in spec.args[1:]}
+            return dict.fromkeys(__arg_names)
+
+        def my_set_lambda(name, coerce, self, val):
+            """my_set_lambda Setter for property on builder.
+
+            :param name: Property Name
+            :type name: Any
+            :param coerce: Coercion utility
+            :type coerce: CallOne
+            :param val: The value to set to the property name
+            :type val: Any
+            :return: self
+            :rtype: SuiBaseBuilder
+            """
+            self.__dict__[name] = coerce(val)
+            return self
+
+        def my_get_lambda(name, self):
+            """my_get_lambda Return the value of propery.
 
-            return var_map
+            :param name: The name of the property
+            :type name: Any
+            :return: The value of the named property
+            :rtype: Any
+            """
+            return self.__dict__[name]
 
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs) -> None:
@@ -305,46 +340,24 @@ def sui_builder(*includes, **kwargs):
                         __var_type_map[attr] = sui_true_type(spec.annotations[attr])
                         # __var_type_map[attr] = spec.annotations[attr]
 
-            def my_set_lambda(name, coerce, self, val):
-                """my_set_lambda Setter for property on builder.
-
-                :param name: Property Name
-                :type name: Any
-                :param coerce: Coercion utility
-                :type coerce: CallOne
-                :param val: The value to set to the property name
-                :type val: Any
-                :return: self
-                :rtype: SuiBaseBuilder
-                """
-                self.__dict__[name] = coerce(val)
-                return self
-
-            def my_get_lambda(name, self):
-                """my_get_lambda Return the value of propery.
-
-                :param name: The name of the property
-                :type name: Any
-                :return: The value of the named property
-                :rtype: Any
-                """
-                return self.__dict__[name]
-
             # Setup the initializing values
             _instance_dict = self.value_type_validator(__host_class, __var_map, __var_type_map)
             for _new_key, _new_val in _instance_dict.items():
                 setattr(self, _new_key, _new_val)
-            # Setup the properties (getter, setter)
+            # Setup the properties (getter, setter), once per class
             myclass = self.__class__
-            for _new_key, _new_val in _instance_dict.items():
-                coercer = COERCION_FN_MAP.get(__var_type_map[_new_key], lambda x: x)
-                setattr(
-                    myclass,
-                    _new_key,
-                    property(
-                        functools.partial(my_get_lambda, _new_key), functools.partial(my_set_lambda, _new_key, coercer)
-                    ),
-                )
+            if myclass not in __property_classes:
+                __property_classes.add(myclass)
+                for _new_key, _new_val in _instance_dict.items():
+                    coercer = COERCION_FN_MAP.get(__var_type_map[_new_key], lambda x: x)
+                    setattr(
+                        myclass,
+                        _new_key,
+                        property(
+                            functools.partial(my_get_lambda, _new_key),
+                            functools.partial(my_set_lambda, _new_key, coercer),
+                        ),
+                    )
 
             # Call the underlying __host_class __init__ function
             return func(self, *args, **kwargs)
@@ -0,0 +1,156 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+# pylint: disable=line-too-long
+
+"""Deprecated synchronous client transaction methods.
+
+Inherited by the synchronous SuiClient.
+"""
+
+import logging
+from deprecated.sphinx import deprecated
+from pysui.sui.sui_clients.common import SuiRpcResult, _warn_deprecated
+from pysui.sui.sui_types.address import SuiAddress
+from pysui.sui.sui_types.scalars import ObjectID, SuiInteger, SuiString
+from pysui.sui.sui_types.collections import SuiArray
+from pysui.sui.sui_builders.exec_builders import (
+    SplitCoinEqually,
+    MoveCall,
+    Publish,
+)
+
+# Same logger as the client so the deprecation warning is logged once
+logger = logging.getLogger("pysui.sync_client")
+
+
+class DeprecatedTxnMixin:
+    """Deprecated SuiClient transaction methods."""
+
+    @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
+    def split_coin_equally_txn(
+        self,
+        *,
+        signer: SuiAddress,
+        coin_object_id: ObjectID,
+        split_count: SuiInteger,
+        gas: ObjectID,
+        gas_budget: SuiInteger,
+    ) -> SuiRpcResult:
+        """split_coin_equally_txn invokes `sui_splitCoinEqual` API.
+
+        :param signer: Transaction signer and owner of coin being split
+        :type signer: SuiAddress
+        :param coin_object_id: the coin object to be spilt
+        :type coin_object_id: ObjectID
+        :param split_count: The count of coins to distribute evenly from coin_object_id
+        :type split_count: SuiInteger
+        :param gas: gas object to be used in this transaction
+        :type gas: ObjectID
+        :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
+        :type gas_budget: SuiInteger
+        :return: Result of the transaction
+        :rtype: SuiRpcResult
+        """
+        _warn_deprecated(logger, "split_coin_equally_txn")
+        return self.execute(
+            SplitCoinEqually(
+                signer=signer,
+                coin_object_id=coin_object_id,
+                split_count=split_count,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
+
+    @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
+    def move_call_txn(
+        self,
+        *,
+        signer: SuiAddress,
+        package_object_id: ObjectID,
+        module: SuiString,
+        function: SuiString,
+        type_arguments: SuiArray[SuiString],
+        arguments: SuiArray[SuiString],
+        gas: ObjectID,
+        gas_budget: SuiInteger,
+    ) -> SuiRpcResult:
+        """move_call_txn invokes `sui_moveCall` API.
+
+        :param signer: Transaction signer
+        :type signer: SuiAddress
+        :param package_object_id: the Move package ID
+        :type package_object_id: ObjectID
+        :param module: The Sui Move module name.
+        :type module: SuiString
+        :param function: The Sui Move function name
+        :type function: SuiString
+        :param type_arguments: The type arguments, if any, of the Sui Move function
+        :type type_arguments: SuiArray[SuiString]
+        :param arguments: The arguments to be passed into the Sui Move function
+        :type arguments: SuiArray[SuiString]
+        :param gas: gas object to be used in this transaction
+        :type gas: ObjectID
+        :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
+        :type gas_budget: SuiInteger
+        :return: Result of the transaction
+        :rtype: SuiRpcResult
+        """
+        _warn_deprecated(logger, "move_call_txn")
+        return self.execute(
+            MoveCall(
+                signer=signer,
+                package_object_id=package_object_id,
+                module=module,
+                function=function,
+                type_arguments=type_arguments,
+                arguments=arguments,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
+
+    @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
+    def publish_package_txn(
+        self,
+        sender: SuiAddress,
+        compiled_modules: SuiArray[SuiString],
+        dependencies: SuiArray[ObjectID],
+        gas: ObjectID,
+        gas_budget: SuiInteger,
+    ) -> SuiRpcResult:
+        """publish_package_txn invokes `sui_publish` API.
+
+        :param sender: the transaction signer's Sui address
+        :type sender: SuiAddress
+        :param compiled_modules: the compiled bytes of a sui move package
+        :type compiled_modules: SuiArray[SuiString]
+        :param dependencies: the package dependencies
+        :type dependencies: SuiArray[ObjectID]
+        :param gas: gas object to be used in this transaction
+        :type gas: ObjectID
+        :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
+        :type gas_budget: SuiInteger
+        :return: Result of the transaction
+        :rtype: SuiRpcResult
+        """
+        _warn_deprecated(logger, "publish_package_txn")
+        return self.execute(
+            Publish(
+                sender=sender,
+                compiled_modules=compiled_modules,
+                dependencies=dependencies,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
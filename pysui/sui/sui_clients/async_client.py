@@ -15,7 +15,6 @@
 """Sui Asynchronous RPC Client module."""
 
 import asyncio
-import ssl
 from typing import Any, Optional, Union
 from json import JSONDecodeError
 import logging
@@ -30,7 +29,13 @@ from pysui import (
     SuiConfig,
 )
 
-from pysui.sui.sui_clients.common import _ClientMixin
+from pysui.sui.sui_clients.common import (
+    _ClientMixin,
+    _exception_data,
+    _json_loads,
+    _SSL_CONTEXT,
+    _warn_deprecated,
+)
 from pysui.sui.sui_crypto import MultiSig, SuiPublicKey
 from pysui.sui.sui_types.scalars import (
     SuiInteger,
@@ -41,8 +46,8 @@ from pysui.sui.sui_types.scalars import (
 from pysui.sui.sui_types.collections import SuiArray, SuiMap
 from pysui.sui.sui_txresults.single_tx import (
     FaucetGasRequest,
+    ObjectRead,
     ObjectReadPage,
-    SuiCoinObjects,
 )
 from pysui.sui.sui_builders.base_builder import SuiBaseBuilder, SuiRequestType
 from pysui.sui.sui_builders.get_builders import (
@@ -69,7 +74,6 @@ from pysui.sui.sui_builders.exec_builders import (
     MoveCall,
     Publish,
 )
-from pysui.sui.sui_utils import partition
 
 logger = logging.getLogger("pysui.async_client")
 if not logging.getLogger().handlers:
@@ -81,6 +85,13 @@ class SuiClient(_ClientMixin):
     """Sui Asyncrhonous Client."""
 
     @versionchanged(version="0.28.0", reason="Added logging")
+    @versionchanged(
+        version="0.29.1", reason="Explicit connection pool and TLS context."
+    )
+    @versionchanged(
+        version="0.29.1",
+        reason="Gas price and protocol config fetched in background.",
+    )
     def __init__(
         self,
         config: SuiConfig,
@@ -89,15 +100,33 @@ class SuiClient(_ClientMixin):
         """Client initializer."""
         super().__init__(config, request_type)
         self._client = httpx.AsyncClient(
-            http2=True,
-            timeout=120.0,
-            verify=ssl.SSLContext(ssl.PROTOCOL_SSLv23),
+            timeout=self._HTTP_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                verify=_SSL_CONTEXT,
+                limits=self._HTTP_LIMITS,
+                retries=self._HTTP_RETRIES,
+            ),
         )
-        self._rpc_api = {}
-        self._schema_dict = {}
-        self._fetch_common_descriptors()
+        self._faucet_client: httpx.AsyncClient = None
+        self._fetch_rpc_api()
+        self._prefetch_common_descriptors(logger)
         logger.info(f"Initialized asynchronous client for {config.rpc_url}")
 
+    @versionadded(
+        version="0.29.1",
+        reason="Await the background fetch of gas price and protocol config.",
+    )
+    async def initialize(self) -> None:
+        """initialize Wait for the gas price and protocol config fetch.
+
+        These are fetched in the background after construction. Reading
+        `current_gas_price`, `protocol` or the protocol limits before the
+        fetch completes blocks the event loop until it does, awaiting this
+        first avoids that.
+        """
+        await asyncio.to_thread(self._ensure_descriptors)
+
     @property
     def is_synchronous(self) -> bool:
         """Return whether client is syncrhonous (True) or not (False)."""
@@ -106,6 +135,7 @@ class SuiClient(_ClientMixin):
     @versionchanged(
         version="0.28.0", reason="Consolidated exception handling."
     )
+    @versionchanged(version="0.29.1", reason="Use orjson for RPC payloads.")
     async def _execute(
         self, builder: SuiBaseBuilder
     ) -> Union[SuiRpcResult, Exception]:
@@ -115,16 +145,16 @@ class SuiClient(_ClientMixin):
             result = await self._client.post(
                 self.config.rpc_url,
                 headers=builder.header,
-                json=self._validate_builder(builder),
+                content=self._validated_content(builder),
             )
             return SuiRpcResult(
                 True,
                 None,
-                result.json(),
+                _json_loads(result.content),
             )
         except JSONDecodeError as jexc:
             return SuiRpcResult(
-                False, f"JSON Decoder Error {jexc.msg}", vars(jexc)
+                False, f"JSON Decoder Error {jexc.msg}", _exception_data(jexc)
             )
         except (
             httpx.HTTPError,
@@ -132,7 +162,9 @@ class SuiClient(_ClientMixin):
             httpx.CookieConflict,
         ) as hexc:
             return SuiRpcResult(
-                False, f"HTTPX error: {hexc.__class__.__name__}", vars(hexc)
+                False,
+                f"HTTPX error: {hexc.__class__.__name__}",
+                _exception_data(hexc),
             )
 
     async def execute(
@@ -142,23 +174,55 @@ class SuiClient(_ClientMixin):
     ) -> Union[SuiRpcResult, Exception]:
         """Execute the builder construct."""
         if not builder.txn_required:
-            result = await self._execute(builder)
-            if result.is_ok():
-                if "error" in result.result_data:
-                    return SuiRpcResult(
-                        False, result.result_data["error"], None
-                    )
-                # print(result.result_data)
-                return SuiRpcResult(
-                    True,
-                    None,
-                    builder.handle_return(result.result_data["result"]),
-                )
-            return result
+            return self._builder_result(builder, await self._execute(builder))
         return await self._multi_signed_execution(
             builder, additional_signatures
         )
 
+    @versionadded(
+        version="0.29.1", reason="Execute many builders concurrently."
+    )
+    async def execute_batch(
+        self, builders: list[SuiBaseBuilder]
+    ) -> list[SuiRpcResult]:
+        """execute_batch Execute builders concurrently.
+
+        All builders are submitted at once over the client's shared
+        connection, then the transaction bytes returned for transaction
+        builders are signed by each builder's authority and executed at once.
+
+        Transactions in one batch are built against the same object
+        versions. A transaction that uses a gas object or an owned input
+        also used by an earlier transaction of the batch is therefore
+        executed on its own, as with `execute`, after the others.
+
+        :param builders: The builders to execute
+        :type builders: list[SuiBaseBuilder]
+        :return: A result for each builder, in the order of builders. A
+            failure to sign a transaction is returned as that builder's result.
+        :rtype: list[SuiRpcResult]
+        """
+        submissions = await asyncio.gather(
+            *[self._execute(builder) for builder in builders]
+        )
+        results, pending, deferred = self._prepare_batch_execution(
+            builders, submissions
+        )
+        executions = await asyncio.gather(
+            *[self._execute(exec_builder) for _, exec_builder in pending]
+        )
+        for (index, exec_builder), result in zip(pending, executions):
+            results[index] = self._builder_result(exec_builder, result)
+        for index in deferred:
+            try:
+                results[index] = await self.execute(builders[index])
+            # pylint: disable=broad-exception-caught
+            except Exception as exc:
+                results[index] = SuiRpcResult(
+                    False, f"Execution failed: {exc}", _exception_data(exc)
+                )
+        return results
+
     async def execute_no_sign(
         self, builder: SuiBaseBuilder
     ) -> Union[SuiRpcResult, Exception]:
@@ -166,17 +230,16 @@ class SuiClient(_ClientMixin):
         if builder.txn_required:
             result = await self._execute(builder)
             if result.is_ok():
-                result = result.result_data
-                if "error" in result:
-                    return SuiRpcResult(
-                        False, result["error"]["message"], None
-                    )
+                data: dict = result.result_data
+                error = data.get("error")
+                if error:
+                    return SuiRpcResult(False, error["message"], None)
                 result = SuiRpcResult(
                     True,
                     None,
                     PreExecutionResult(
                         builder.authority,
-                        builder.handle_return(result["result"]),
+                        builder.handle_return(data["result"]),
                     ),
                 )
                 # result = SuiRpcResult(True, None, (builder.authority, SuiTxBytes(result["result"]["txBytes"])))
@@ -204,10 +267,12 @@ class SuiClient(_ClientMixin):
                 if isinstance(new_sig, SuiSignature):
                     sig_array = [new_sig]
                     if signers:
+                        raw_bytes = tx_bytes.tx_bytes
+                        keypair_for = self.config.keypair_for_address
                         sig_array.extend(
                             [
-                                kpair.new_sign_secure(tx_bytes)
-                                for kpair in signers.array
+                                keypair_for(addy).new_sign_secure(raw_bytes)
+                                for addy in signers.array
                             ]
                         )
                     exec_tx = ExecuteTransaction(
@@ -237,28 +302,14 @@ class SuiClient(_ClientMixin):
         :return: Result of execution
         :rtype: Union[SuiRpcResult, Exception]
         """
-        signers_list = []
-        signers_list.append(self.config.keypair_for_address(signer))
-        if additional_signatures:
-            for addy in additional_signatures.array:
-                signers_list.append(self.config.keypair_for_address(addy))
         builder = ExecuteTransaction(
             tx_bytes=tx_bytes,
-            signatures=SuiArray(
-                [
-                    kpair.new_sign_secure(tx_bytes.tx_bytes)
-                    for kpair in signers_list
-                ]
+            signatures=self._sign_tx_bytes(
+                tx_bytes, signer, additional_signatures
             ),
             request_type=self.request_type,
         )
-        result = await self._execute(builder)
-        if result.is_ok() and "error" not in result.result_data:
-            # print(result.result_data["result"])
-            result = SuiRpcResult(
-                True, None, builder.handle_return(result.result_data["result"])
-            )
-        return result
+        return self._builder_result(builder, await self._execute(builder))
 
     async def dry_run(
         self, builder: SuiBaseBuilder
@@ -267,7 +318,7 @@ class SuiClient(_ClientMixin):
         if builder.txn_required:
             result = await self.execute_no_sign(builder)
             if result.is_ok():
-                result = self.execute(
+                result = await self.execute(
                     DryRunTransaction(tx_bytes=result.result_data.tx_bytes)
                 )
             return result
@@ -275,34 +326,43 @@ class SuiClient(_ClientMixin):
             False, "dry_run is used only with transaction types"
         )
 
+    @versionchanged(
+        version="0.29.1",
+        reason="Submit and execute without intermediate result wrapping.",
+    )
     async def _multi_signed_execution(
         self,
         builder: SuiBaseBuilder,
         additional_signers: SuiArray[SuiAddress] = None,
     ) -> Union[SuiRpcResult, Exception]:
-        """."""
-        result = await self.execute_no_sign(builder)
-        if result.is_ok():
-            exec_builder = self.sign_for_execution(
-                result.result_data.tx_bytes, builder, additional_signers
-            )
-            result = await self._execute(exec_builder)
-            if result.is_ok() and "error" not in result.result_data:
-                # print(result.result_data["result"])
-                result = SuiRpcResult(
-                    True,
-                    None,
-                    exec_builder.handle_return(result.result_data["result"]),
-                )
-            else:
-                result = SuiRpcResult(False, result.result_data["error"])
-        return result
+        """Submit the transaction builder, sign the resulting bytes and execute.
+
+        Only the transaction bytes are taken from the submission response, the
+        full `TransactionBytes` result is not decoded.
+        """
+        result = await self._execute(builder)
+        if not result.is_ok():
+            return result
+        data: dict = result.result_data
+        error = data.get("error")
+        if error:
+            return SuiRpcResult(False, error["message"], None)
+        exec_builder = self.sign_for_execution(
+            SuiTxBytes(data["result"]["txBytes"]), builder, additional_signers
+        )
+        return self._builder_result(
+            exec_builder, await self._execute(exec_builder)
+        )
 
     # Build and execute convenience methods
     @versionchanged(
         version="0.28.0",
         reason="Support for > RPC provider limits of coin objects for owner.",
     )
+    @versionchanged(
+        version="0.29.1",
+        reason="Accumulate fetch_all pages into one presized list.",
+    )
     async def _get_coins_for_type(
         self,
         *,
@@ -325,28 +385,61 @@ class SuiClient(_ClientMixin):
         )
         if result.is_ok():
             limit: int = result.result_data.coin_object_count
-            builder = GetCoins(owner=address, coin_type=coin_type)
             if limit > self.max_gets and fetch_all:
-                accumer: list = []
-                gasses = handle_result(await self.execute(builder))
-                accumer.extend(gasses.data)
-                while gasses.next_cursor:
-                    builder.cursor = gasses.next_cursor
-                    gasses = handle_result(await self.execute(builder))
-                    accumer.extend(gasses.data)
-                result = SuiRpcResult(
-                    True,
-                    "",
-                    SuiCoinObjects.from_dict(
-                        {"data": accumer, "next_cursor": None}
-                    ),
+                result = await self._fetch_all_coin_pages(
+                    address=address, coin_type=coin_type, expected=limit
                 )
             # if < 50 or > 50 and fetch_all false
             # legacy behavior
             else:
-                result = await self.execute(builder)
+                result = await self.execute(
+                    GetCoins(owner=address, coin_type=coin_type)
+                )
         return result
 
+    async def _fetch_all_coin_pages(
+        self, *, address: SuiAddress, coin_type: SuiString, expected: int
+    ) -> SuiRpcResult:
+        """_fetch_all_coin_pages Walks all GetCoins pages for address and coin_type.
+
+        :param address: The address to fetch coins of coin_type for
+        :type address: SuiAddress
+        :param coin_type: Fully qualified type names for the coin
+        :type coin_type: SuiString
+        :param expected: Coin object count reported by balance, used to presize the accumulator
+        :type expected: int
+        :return: If successful, result contains an array of all coins objects of coin_type found
+        :rtype: SuiRpcResult
+        """
+        builder = GetCoins(owner=address, coin_type=coin_type)
+        accumer: list = [None] * expected
+        index: int = 0
+        page_builder: GetCoins = builder
+        while page_builder:
+            result = await self._execute(page_builder)
+            if result.is_err():
+                return result
+            if "error" in result.result_data:
+                return SuiRpcResult(False, result.result_data["error"], None)
+            page: dict = result.result_data["result"]
+            page_len = len(page["data"])
+            accumer[index : index + page_len] = page["data"]
+            index += page_len
+            page_builder = None
+            if page["nextCursor"] and page.get("hasNextPage", True):
+                page_builder = GetCoins(
+                    owner=address,
+                    coin_type=coin_type,
+                    cursor=ObjectID(page["nextCursor"]),
+                )
+        # Coin count may have changed since the balance was fetched
+        del accumer[index:]
+        return SuiRpcResult(
+            True,
+            "",
+            builder.handle_return({"data": accumer, "nextCursor": None}),
+        )
+
     @versionadded(
         version="0.26.1",
         reason="Implement closing underlying httpx transport.",
@@ -357,8 +450,24 @@ class SuiClient(_ClientMixin):
         Does not usually need to be called but put in place as part of commingling with websocket activity.
         """
         await self._client.aclose()
+        if self._faucet_client:
+            await self._faucet_client.aclose()
         self._transport_open = False
 
+    @versionadded(
+        version="0.29.1", reason="Client usable as an async context manager."
+    )
+    async def __aenter__(self) -> "SuiClient":
+        """Enter the client context."""
+        return self
+
+    @versionadded(
+        version="0.29.1", reason="Client usable as an async context manager."
+    )
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the client's connections on leaving the context."""
+        await self.close()
+
     @versionchanged(
         version="0.28.0",
         reason="Added fetch_all as currently limited by RPC providers results",
@@ -408,6 +517,27 @@ class SuiClient(_ClientMixin):
             address=address, coin_type=coin_type, fetch_all=fetch_all
         )
 
+    @versionadded(
+        version="0.29.1",
+        reason="Dedicated faucet connection, created on first use.",
+    )
+    def _get_faucet_client(self) -> httpx.AsyncClient:
+        """Return the faucet client, creating it on first use.
+
+        The faucet is usually a different host than the RPC url so it keeps its own connection alive.
+        """
+        if self._faucet_client is None:
+            self._faucet_client = httpx.AsyncClient(
+                timeout=self._HTTP_TIMEOUT,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    verify=_SSL_CONTEXT,
+                    limits=self._FAUCET_LIMITS,
+                    retries=self._HTTP_RETRIES,
+                ),
+            )
+        return self._faucet_client
+
     async def get_gas_from_faucet(self, for_address: SuiAddress = None) -> Any:
         """get_gas_from_faucet Gets gas from SUI faucet.
 
@@ -419,7 +549,7 @@ class SuiClient(_ClientMixin):
         """
         for_address = for_address or self.config.active_address
         try:
-            result = await self._client.post(
+            result = await self._get_faucet_client().post(
                 self.config.faucet_url,
                 headers=GetObjectsOwnedByAddress(for_address).header,
                 json={"FixedAmountRequest": {"recipient": f"{for_address}"}},
@@ -432,12 +562,14 @@ class SuiClient(_ClientMixin):
             return SuiRpcResult(False, result["error"])
         except JSONDecodeError as jexc:
             return SuiRpcResult(
-                False, f"JSON Decoder Error {jexc.msg}", vars(jexc)
+                False, f"JSON Decoder Error {jexc.msg}", _exception_data(jexc)
             )
         except httpx.ReadTimeout as hexc:
-            return SuiRpcResult(False, "HTTP read timeout error", vars(hexc))
+            return SuiRpcResult(
+                False, "HTTP read timeout error", _exception_data(hexc)
+            )
         except TypeError as texc:
-            return SuiRpcResult(False, "Type error", vars(texc))
+            return SuiRpcResult(False, "Type error", _exception_data(texc))
 
     @versionchanged(
         version="0.28.0",
@@ -482,6 +614,9 @@ class SuiClient(_ClientMixin):
                 result = SuiRpcResult(True, "", objread_page)
         return result
 
+    @versionchanged(
+        version="0.29.1", reason="Immutable results are cached per client."
+    )
     async def get_object(
         self, identifier: ObjectID, version: SuiInteger = None
     ) -> Union[SuiRpcResult, Exception]:
@@ -494,16 +629,26 @@ class SuiClient(_ClientMixin):
         :return: The objeect's ObjectRead data
         :rtype: Union[SuiRpcResult, Exception]
         """
-        return await self.execute(
-            GetObject(object_id=identifier)
-            if version is None
-            else GetPastObject(identifier, version)
-        )
+        if version is None:
+            return await self.execute(GetObject(object_id=identifier))
+        # A specific object version is immutable
+        key = ("object", str(identifier), str(version))
+        result = self._cached_result(key)
+        if result is None:
+            result = await self.execute(GetPastObject(identifier, version))
+            self._cache_result(
+                key, result, isinstance(result.result_data, ObjectRead)
+            )
+        return result
 
     @versionchanged(
         version="0.29.0",
         reason="Handles large identifier list",
     )
+    @versionchanged(
+        version="0.29.1",
+        reason="A failed chunk is returned as the error result.",
+    )
     async def get_objects_for(
         self, identifiers: list[ObjectID]
     ) -> Union[SuiRpcResult, Exception]:
@@ -519,14 +664,27 @@ class SuiClient(_ClientMixin):
         # Use new multi get
         if len(identifiers) > self.max_gets:
             accum: list = []
+            max_gets = self.max_gets
             addy_list = [
-                self.execute(GetMultipleObjects(object_ids=x))
-                for x in list(partition(identifiers, self.max_gets))
+                self.execute(
+                    GetMultipleObjects(
+                        object_ids=identifiers[index : index + max_gets]
+                    )
+                )
+                for index in range(0, len(identifiers), max_gets)
             ]
             gresult = await asyncio.gather(*addy_list, return_exceptions=True)
+            # Any failed chunk fails the whole call
             for gres in gresult:
-                if gres.is_ok():
-                    accum.extend(gres.result_data)
+                if isinstance(gres, BaseException):
+                    return SuiRpcResult(
+                        False,
+                        f"get_objects_for chunk raised {gres!r}",
+                        _exception_data(gres),
+                    )
+                if gres.is_err():
+                    return gres
+                accum.extend(gres.result_data)
             result = SuiRpcResult(True, None, accum)
         else:
             result = await self.execute(
@@ -536,6 +694,9 @@ class SuiClient(_ClientMixin):
         return result
         # return await self.execute(GetMultipleObjects(object_ids=identifiers))
 
+    @versionchanged(
+        version="0.29.1", reason="Immutable results are cached per client."
+    )
     async def get_package(
         self, package_id: ObjectID
     ) -> Union[SuiRpcResult, Exception]:
@@ -548,7 +709,13 @@ class SuiClient(_ClientMixin):
         :returns: The package detail data
         :rtype: SuiRpcResult
         """
-        result = await self.execute(GetPackage(package=package_id))
+        # Packages are immutable once published
+        key = ("package", str(package_id))
+        result = self._cached_result(key)
+        if result is None:
+            result = self._cache_result(
+                key, await self.execute(GetPackage(package=package_id))
+            )
         return result
 
     async def get_events(
@@ -572,9 +739,14 @@ class SuiClient(_ClientMixin):
         :return: API call result
         :rtype: SuiRpcResult
         """
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(QueryEvents(**inargs))
+        return await self.execute(
+            QueryEvents(
+                query=query,
+                cursor=cursor,
+                limit=limit,
+                descending_order=descending_order,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def pay_txn(
@@ -606,10 +778,17 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: pay_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(Pay(**inargs))
+        _warn_deprecated(logger, "pay_txn")
+        return await self.execute(
+            Pay(
+                signer=signer,
+                input_coins=input_coins,
+                recipients=recipients,
+                amounts=amounts,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def pay_sui_txn(
@@ -638,10 +817,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: pay_sui_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(PaySui(**inargs))
+        _warn_deprecated(logger, "pay_sui_txn")
+        return await self.execute(
+            PaySui(
+                signer=signer,
+                input_coins=input_coins,
+                recipients=recipients,
+                amounts=amounts,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def pay_allsui_txn(
@@ -665,10 +850,15 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: pay_allsui_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(PayAllSui(**inargs))
+        _warn_deprecated(logger, "pay_allsui_txn")
+        return await self.execute(
+            PayAllSui(
+                signer=signer,
+                input_coins=input_coins,
+                recipient=recipient,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def transfer_sui_txn(
@@ -695,10 +885,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: transfer_sui_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(TransferSui(**inargs))
+        _warn_deprecated(logger, "transfer_sui_txn")
+        return await self.execute(
+            TransferSui(
+                signer=signer,
+                sui_object_id=sui_object_id,
+                gas_budget=gas_budget,
+                recipient=recipient,
+                amount=amount,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def transfer_object_txn(
@@ -725,10 +921,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: transfer_object_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(TransferObject(**inargs))
+        _warn_deprecated(logger, "transfer_object_txn")
+        return await self.execute(
+            TransferObject(
+                signer=signer,
+                object_id=object_id,
+                gas=gas,
+                gas_budget=gas_budget,
+                recipient=recipient,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def merge_coin_txn(
@@ -756,10 +958,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: merge_coin_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(MergeCoin(**inargs))
+        _warn_deprecated(logger, "merge_coin_txn")
+        return await self.execute(
+            MergeCoin(
+                signer=signer,
+                primary_coin=primary_coin,
+                coin_to_merge=coin_to_merge,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def split_coin_txn(
@@ -786,10 +994,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: split_coin_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(SplitCoin(**inargs))
+        _warn_deprecated(logger, "split_coin_txn")
+        return await self.execute(
+            SplitCoin(
+                signer=signer,
+                coin_object_id=coin_object_id,
+                split_amounts=split_amounts,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def split_coin_equally_txn(
@@ -816,10 +1030,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: split_coin_equally_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(SplitCoinEqually(**inargs))
+        _warn_deprecated(logger, "split_coin_equally_txn")
+        return await self.execute(
+            SplitCoinEqually(
+                signer=signer,
+                coin_object_id=coin_object_id,
+                split_count=split_count,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def move_call_txn(
@@ -855,16 +1075,26 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: move_call_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(MoveCall(**inargs))
+        _warn_deprecated(logger, "move_call_txn")
+        return await self.execute(
+            MoveCall(
+                signer=signer,
+                package_object_id=package_object_id,
+                module=module,
+                function=function,
+                type_arguments=type_arguments,
+                arguments=arguments,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     async def publish_package_txn(
         self,
         sender: SuiAddress,
         compiled_modules: SuiArray[SuiString],
+        dependencies: SuiArray[ObjectID],
         gas: ObjectID,
         gas_budget: SuiInteger,
     ) -> SuiRpcResult:
@@ -874,6 +1104,8 @@ class SuiClient(_ClientMixin):
         :type sender: SuiAddress
         :param compiled_modules: the compiled bytes of a sui move package
         :type compiled_modules: SuiArray[SuiString]
+        :param dependencies: the package dependencies
+        :type dependencies: SuiArray[ObjectID]
         :param gas: gas object to be used in this transaction
         :type gas: ObjectID
         :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
@@ -881,7 +1113,13 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: publish_package_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return await self.execute(Publish(**inargs))
+        _warn_deprecated(logger, "publish_package_txn")
+        return await self.execute(
+            Publish(
+                sender=sender,
+                compiled_modules=compiled_modules,
+                dependencies=dependencies,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
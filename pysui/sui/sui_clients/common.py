@@ -13,17 +13,27 @@
 
 """Sui Client common classes module."""
 
+import copy
 import os
 import sys
 import json
+import logging
+import ssl
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from abc import abstractmethod
 from typing import Any, Optional, Union
 from pkg_resources import packaging
+import certifi
 import httpx
 from deprecated.sphinx import versionchanged, versionadded
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pysui.abstracts import RpcResult, Provider
-from pysui.abstracts.client_keypair import KeyPair
 from pysui.sui.sui_builders.base_builder import SuiBaseBuilder, SuiRequestType
 from pysui.sui.sui_builders.exec_builders import (
     _MoveCallTransactionBuilder,
@@ -56,6 +66,11 @@ class SuiRpcResult(RpcResult):
     Captures information returned from simple and complex RPC API calls
     """
 
+    __slots__ = ("_status", "_result_str", "_data")
+
+    @versionchanged(
+        version="0.29.1", reason="Slotted to reduce per result overhead."
+    )
     def __init__(
         self, result_status: bool, result_string: str, result_data: Any = None
     ) -> None:
@@ -68,7 +83,6 @@ class SuiRpcResult(RpcResult):
         :param result_data: If success, contains data realized by RPC result, defaults to None
         :type result_data: Any, optional
         """
-        super().__init__()
         self._status: bool = result_status
         self._result_str: str = result_string
         self._data: Any = result_data
@@ -92,7 +106,10 @@ class SuiRpcResult(RpcResult):
         return self._result_str
 
 
-@dataclass
+@versionchanged(
+    version="0.29.1", reason="Slotted to reduce per result overhead."
+)
+@dataclass(slots=True)
 class PreExecutionResult:
     """Results of pre-execution transaction submission."""
 
@@ -142,6 +159,95 @@ def handle_result(
     return handler(from_cmd)
 
 
+def _json_bytes(payload: Union[dict, list]) -> bytes:
+    """Serialize RPC payload to JSON bytes.
+
+    Uses orjson when installed, falling back to the standard library for
+    values orjson rejects (e.g. integers exceeding 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload).encode()
+
+
+def _json_loads(content: Union[bytes, bytearray]) -> Any:
+    """Decode a JSON RPC response body, with orjson when installed.
+
+    Decoding errors raise a `json.JSONDecodeError` either way.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _exception_data(exc: Exception) -> dict:
+    """Summarize an exception for a failed result's data.
+
+    Unlike `vars(exc)` this holds no reference to the decoded document or
+    to httpx request/response objects (and their buffered content).
+    """
+    data = {"type": exc.__class__.__name__, "message": str(exc)}
+    if isinstance(exc, json.JSONDecodeError):
+        data.update(
+            {
+                "msg": exc.msg,
+                "pos": exc.pos,
+                "lineno": exc.lineno,
+                "colno": exc.colno,
+            }
+        )
+    elif isinstance(exc, httpx.HTTPError):
+        try:
+            data["url"] = str(exc.request.url)
+        except RuntimeError:
+            data["url"] = None
+    return data
+
+
+def _owned_objects(tx_bytes: dict) -> set[str]:
+    """Return the gas and owned (or immutable) input object ids of a `TransactionBytes` result.
+
+    Shared objects and packages are left out, transactions using the same
+    ones do not conflict.
+    """
+    owned = {gas_ref["objectId"] for gas_ref in tx_bytes.get("gas", ())}
+    for tx_input in tx_bytes.get("inputObjects", ()):
+        if isinstance(tx_input, dict) and "ImmOrOwnedMoveObject" in tx_input:
+            owned.add(tx_input["ImmOrOwnedMoveObject"]["objectId"])
+    return owned
+
+
+# Deprecated methods already reported, as (logger name, method) pairs
+_warned: set[tuple[str, str]] = set()
+
+
+def _warn_deprecated(log: logging.Logger, method: str) -> None:
+    """Log the use of a deprecated method, once per logger and method."""
+    key = (log.name, method)
+    if key not in _warned:
+        _warned.add(key)
+        log.warning(f"using deprecated method: {method}")
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    """Build the TLS context shared by all client connections.
+
+    Certificates are verified against the certifi bundle, as httpx does by
+    default. httpx does not set ALPN on a caller supplied context, so it is
+    set here for HTTP/2 to be negotiated.
+    """
+    context = ssl.create_default_context(cafile=certifi.where())
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    context.set_alpn_protocols(["h2", "http/1.1"])
+    return context
+
+
+_SSL_CONTEXT: ssl.SSLContext = _build_ssl_context()
+
+
 class _ClientMixin(Provider):
     """Abstract Mix-in.
 
@@ -156,6 +262,15 @@ class _ClientMixin(Provider):
         "signature error",
     }
     _RPC_GET_LIMITS: int = 50
+    _HTTP_TIMEOUT: httpx.Timeout = httpx.Timeout(120.0, connect=10.0)
+    _HTTP_LIMITS: httpx.Limits = httpx.Limits(
+        max_keepalive_connections=32,
+        max_connections=64,
+        keepalive_expiry=60.0,
+    )
+    _HTTP_RETRIES: int = 2
+    _FAUCET_LIMITS: httpx.Limits = httpx.Limits(max_keepalive_connections=2)
+    _IMMUTABLE_CACHE_SIZE: int = 256
 
     @versionchanged(
         version="0.26.1",
@@ -180,17 +295,22 @@ class _ClientMixin(Provider):
         self._rpc_version: str = None
         self._request_type: SuiRequestType = request_type
         self._protocol: ProtocolConfig = None
+        self._descriptors_lock = threading.Lock()
+        self._descriptors_fetched: bool = False
+        self._immutable_cache: OrderedDict = OrderedDict()
+        self._immutable_cache_lock = threading.Lock()
 
-    @versionchanged(
-        version="0.28.0",
-        reason="Renamed for semantics added fetching current protocol",
+    @versionadded(
+        version="0.29.1",
+        reason="RPC API descriptors fetched apart from common descriptors.",
     )
-    def _fetch_common_descriptors(self) -> None:
-        """Fetch RPC method descrptors."""
-        builder_rpc_api = GetRpcAPI()
-        builder_gas_price = GetReferenceGasPrice()
-        builder_protocol = GetProtocolConfig()
+    def _fetch_rpc_api(self) -> None:
+        """Fetch RPC method descriptors and validate the RPC version.
 
+        Called by the client constructors, so an unreachable host or an
+        unsupported RPC version fails construction.
+        """
+        builder_rpc_api = GetRpcAPI()
         with httpx.Client(http2=True) as client:
             rpc_api_result = client.post(
                 self.config.rpc_url,
@@ -201,6 +321,28 @@ class _ClientMixin(Provider):
                     builder_rpc_api.params,
                 ),
             )
+        (
+            self._rpc_version,
+            self._rpc_api,
+            self._schema_dict,
+        ) = build_api_descriptors(_json_loads(rpc_api_result.content))
+        self.rpc_version_support()
+        os.environ[PYSUI_RPC_VERSION] = self._rpc_version
+
+    @versionchanged(
+        version="0.28.0",
+        reason="Renamed for semantics added fetching current protocol",
+    )
+    @versionchanged(
+        version="0.29.1",
+        reason="RPC API descriptors are fetched by _fetch_rpc_api.",
+    )
+    def _fetch_common_descriptors(self) -> None:
+        """Fetch reference gas price and protocol config."""
+        builder_gas_price = GetReferenceGasPrice()
+        builder_protocol = GetProtocolConfig()
+
+        with httpx.Client(http2=True) as client:
             rpc_gas_result = client.post(
                 self.config.rpc_url,
                 headers=builder_gas_price.header,
@@ -220,17 +362,39 @@ class _ClientMixin(Provider):
                 ),
             )
             self._protocol = ProtocolConfig.from_dict(
-                rpc_protocol_result.json()["result"]
+                _json_loads(rpc_protocol_result.content)["result"]
             )
-            self._gas_price = rpc_gas_result.json()["result"]
+            self._gas_price = _json_loads(rpc_gas_result.content)["result"]
 
-        (
-            self._rpc_version,
-            self._rpc_api,
-            self._schema_dict,
-        ) = build_api_descriptors(rpc_api_result.json())
-        self.rpc_version_support()
-        os.environ[PYSUI_RPC_VERSION] = self._rpc_version
+    @versionadded(
+        version="0.29.1",
+        reason="Common descriptors are fetched in background and on first use.",
+    )
+    def _prefetch_common_descriptors(self, log: logging.Logger) -> None:
+        """Start fetching gas price and protocol config in the background.
+
+        A failure is logged and the fetch retried by the first caller of
+        _ensure_descriptors.
+        """
+
+        def _prefetch():
+            try:
+                self._ensure_descriptors()
+            except Exception:  # pylint: disable=broad-exception-caught
+                log.warning(
+                    f"Background fetch from {self.config.rpc_url} failed",
+                    exc_info=True,
+                )
+
+        threading.Thread(target=_prefetch, daemon=True).start()
+
+    def _ensure_descriptors(self) -> None:
+        """Fetch gas price and protocol config if not already done, waiting on any fetch in progress."""
+        if not self._descriptors_fetched:
+            with self._descriptors_lock:
+                if not self._descriptors_fetched:
+                    self._fetch_common_descriptors()
+                    self._descriptors_fetched = True
 
     def _generate_data_block(
         self, data_block: dict, method: str, params: list
@@ -243,21 +407,103 @@ class _ClientMixin(Provider):
     @versionchanged(
         version="0.24.0", reason="Moved from list to dict for RPC params"
     )
+    @versionchanged(
+        version="0.29.1",
+        reason="Reuse validated data block until builder changes",
+    )
     def _validate_builder(
         self, builder: SuiBaseBuilder
     ) -> Union[dict, SuiRpcApiNotAvailable]:
-        """Validate SUI RPC API field alignment."""
-        if not builder.method in self._rpc_api:
+        """Validate SUI RPC API field alignment.
+
+        The resulting data block is cached on the builder and reused until
+        one of the builder's public attributes is set. Changing the contents
+        of a parameter in place (e.g. appending to a SuiArray) is not seen,
+        assign the attribute again for it to be picked up.
+        """
+        api = self._rpc_api.get(builder.method)
+        if api is None:
             raise SuiRpcApiNotAvailable(builder.method)
-        parm_results = validate_api(self._rpc_api[builder.method], builder)
+        cached = builder.__dict__.get("_envelope_cache")
+        if cached and cached[0] is api:
+            return cached[1]
+        parm_results = validate_api(api, builder)
         # parm_results = [y for x, y in validate_api(self._rpc_api[builder.method], builder)]
         jblock = self._generate_data_block(
             builder.data_dict, builder.method, parm_results
         )
         # print(f"{json.dumps(jblock, indent=2)}")
-
+        builder._envelope_cache = (api, jblock)
         return jblock
 
+    @versionadded(
+        version="0.29.1",
+        reason="Serialize validated data block once per builder state.",
+    )
+    def _validated_content(self, builder: SuiBaseBuilder) -> bytes:
+        """Validate the builder and return its data block as JSON bytes.
+
+        The serialized bytes are cached with the data block on the builder.
+        """
+        jblock = self._validate_builder(builder)
+        cached = builder._envelope_cache
+        if len(cached) == 2:
+            cached = (*cached, _json_bytes(jblock))
+            builder._envelope_cache = cached
+        return cached[2]
+
+    @versionadded(
+        version="0.29.1",
+        reason="Shared by synchronous and asynchronous clients.",
+    )
+    @staticmethod
+    def _builder_result(
+        builder: SuiBaseBuilder, result: SuiRpcResult
+    ) -> SuiRpcResult:
+        """Convert a raw RPC response result to the builder's return type."""
+        if result.is_ok():
+            data: dict = result.result_data
+            error = data.get("error")
+            if error:
+                return SuiRpcResult(False, error, None)
+            return SuiRpcResult(
+                True, None, builder.handle_return(data["result"])
+            )
+        return result
+
+    @versionadded(
+        version="0.29.1",
+        reason="Cache results of immutable packages and object versions.",
+    )
+    def _cached_result(self, key: tuple) -> Optional[SuiRpcResult]:
+        """Return a copy of the cached immutable result for key, if any.
+
+        Each caller gets its own copy of the result data, so changes made
+        by one caller are not seen by others.
+        """
+        with self._immutable_cache_lock:
+            data = self._immutable_cache.get(key)
+            if data is None:
+                return None
+            self._immutable_cache.move_to_end(key)
+        return SuiRpcResult(True, None, copy.deepcopy(data))
+
+    def _cache_result(
+        self, key: tuple, result: SuiRpcResult, cacheable: bool = True
+    ) -> SuiRpcResult:
+        """Cache a copy of result's data under key if successful and cacheable.
+
+        The least recently used entry is evicted when the cache is full.
+        """
+        if cacheable and result.is_ok():
+            data = copy.deepcopy(result.result_data)
+            with self._immutable_cache_lock:
+                self._immutable_cache[key] = data
+                self._immutable_cache.move_to_end(key)
+                if len(self._immutable_cache) > self._IMMUTABLE_CACHE_SIZE:
+                    self._immutable_cache.popitem(last=False)
+        return result
+
     @versionadded(
         version="0.26.1",
         reason="Added to support transport state information.",
@@ -275,6 +521,7 @@ class _ClientMixin(Provider):
     @property
     def current_gas_price(self) -> int:
         """Returns session gas price."""
+        self._ensure_descriptors()
         return int(self._gas_price)
 
     @property
@@ -318,7 +565,7 @@ class _ClientMixin(Provider):
 
         :raises RuntimeError: If RPC API version less than minimal support
         """
-        rpa = packaging.version.parse(self.rpc_version)
+        rpa = packaging.version.parse(self._rpc_version)
         mpa = packaging.version.parse(self._RPC_MINIMAL_VERSION)
         ipa = packaging.version.parse(self._RPC_REQUIRED_VERSION)
         if rpa >= ipa:
@@ -342,6 +589,70 @@ class _ClientMixin(Provider):
             return True
         return False
 
+    @versionadded(
+        version="0.29.1", reason="Shared by the clients' execute_batch."
+    )
+    def _prepare_batch_execution(
+        self, builders: list[SuiBaseBuilder], submissions: list[SuiRpcResult]
+    ) -> tuple[
+        list[SuiRpcResult], list[tuple[int, ExecuteTransaction]], list[int]
+    ]:
+        """Sort submitted batch builders into results and remaining work.
+
+        Builders that are not transactions, and transactions whose
+        submission failed, get their final result. A transaction whose gas
+        and owned inputs are not used by an earlier transaction of the batch
+        is signed for execution. One that shares gas or an owned input with
+        an earlier transaction was built against object versions that the
+        earlier one changes, it is left to be executed on its own afterwards.
+        A signing failure is that builder's result.
+
+        :param builders: The batch builders
+        :type builders: list[SuiBaseBuilder]
+        :param submissions: The raw result of submitting each builder
+        :type submissions: list[SuiRpcResult]
+        :return: The results so far, (index, execution builder) pairs of the
+            signed transactions and the indexes of deferred transactions
+        :rtype: tuple[list[SuiRpcResult], list[tuple[int, ExecuteTransaction]], list[int]]
+        """
+        results: list[SuiRpcResult] = []
+        pending: list[tuple[int, ExecuteTransaction]] = []
+        deferred: list[int] = []
+        claimed: set[str] = set()
+        for index, (builder, result) in enumerate(zip(builders, submissions)):
+            if not builder.txn_required:
+                result = self._builder_result(builder, result)
+            elif result.is_ok():
+                data: dict = result.result_data
+                error = data.get("error")
+                if error:
+                    result = SuiRpcResult(False, error["message"], None)
+                else:
+                    owned = _owned_objects(data["result"])
+                    if owned & claimed:
+                        deferred.append(index)
+                    else:
+                        try:
+                            pending.append(
+                                (
+                                    index,
+                                    self.sign_for_execution(
+                                        SuiTxBytes(data["result"]["txBytes"]),
+                                        builder,
+                                    ),
+                                )
+                            )
+                            claimed |= owned
+                        # pylint: disable=broad-exception-caught
+                        except Exception as exc:
+                            result = SuiRpcResult(
+                                False,
+                                f"Signing failed: {exc}",
+                                _exception_data(exc),
+                            )
+            results.append(result)
+        return results, pending, deferred
+
     def sign_for_execution(
         self,
         tx_bytes: SuiTxBytes,
@@ -362,28 +673,47 @@ class _ClientMixin(Provider):
         """
         if not builder.txn_required:
             raise SuiNotComplexTransaction(builder.__class__.__name__)
-        # Gather keypairs for signing
-        signers_list: list[KeyPair] = []
-        base_signer = builder.authority
-        signers_list.append(self.config.keypair_for_address(base_signer))
-        if signers:
-            for other_address in signers.array:
-                signers_list.append(
-                    self.config.keypair_for_address(other_address)
-                )
-        # Iterate and return signatures list
-        total_signed = SuiArray(
-            [
-                kpair.new_sign_secure(tx_bytes.tx_bytes)
-                for kpair in signers_list
-            ]
-        )
         return ExecuteTransaction(
             tx_bytes=tx_bytes,
-            signatures=total_signed,
+            signatures=self._sign_tx_bytes(
+                tx_bytes, builder.authority, signers
+            ),
             request_type=self.request_type,
         )
 
+    @versionadded(
+        version="0.29.1",
+        reason="Consolidated signature gathering for transaction execution.",
+    )
+    def _sign_tx_bytes(
+        self,
+        tx_bytes: SuiTxBytes,
+        signer: SuiAddress,
+        additional_signers: Optional[SuiArray[SuiAddress]] = None,
+    ) -> SuiArray:
+        """_sign_tx_bytes Sign transaction bytes with the keypair of signer and any additional signers.
+
+        :param tx_bytes: Transaction bytes from transaction method submission.
+        :type tx_bytes: SuiTxBytes
+        :param signer: The primary signer's address
+        :type signer: SuiAddress
+        :param additional_signers: Additional signers, defaults to None
+        :type additional_signers: Optional[SuiArray[SuiAddress]], optional
+        :return: The signatures in signer order
+        :rtype: SuiArray
+        """
+        raw_bytes = tx_bytes.tx_bytes
+        keypair_for = self.config.keypair_for_address
+        return SuiArray(
+            [
+                keypair_for(addy).new_sign_secure(raw_bytes)
+                for addy in (
+                    signer,
+                    *(additional_signers.array if additional_signers else ()),
+                )
+            ]
+        )
+
     # Protocol properties
     @versionadded(
         version="0.28.0", reason="Connection specific ProtcolConfig."
@@ -391,6 +721,7 @@ class _ClientMixin(Provider):
     @property
     def protocol(self) -> ProtocolConfig:
         """Return the raw protocol config in place for the connection."""
+        self._ensure_descriptors()
         return self._protocol
 
     @versionadded(
@@ -407,7 +738,7 @@ class _ClientMixin(Provider):
     @property
     def max_arguments(self) -> int:
         """Return maximum transaction arguments."""
-        return int(self._protocol.attributes["max_arguments"]["u32"])
+        return int(self.protocol.attributes["max_arguments"]["u32"])
 
     @versionadded(
         version="0.29.0", reason="Added constraint for RPC sfetches."
@@ -415,7 +746,7 @@ class _ClientMixin(Provider):
     @property
     def max_input_objects(self) -> int:
         """Return maximum transaction builder inputs."""
-        return int(self._protocol.attributes["max_input_objects"]["u64"])
+        return int(self.protocol.attributes["max_input_objects"]["u64"])
 
     @versionadded(
         version="0.29.0", reason="Added constraint for RPC sfetches."
@@ -424,7 +755,7 @@ class _ClientMixin(Provider):
     def max_num_transferred_move_object_ids(self) -> int:
         """Return maximum transaction transfer objects."""
         return int(
-            self._protocol.attributes["max_num_transferred_move_object_ids"][
+            self.protocol.attributes["max_num_transferred_move_object_ids"][
                 "u64"
             ]
         )
@@ -436,7 +767,7 @@ class _ClientMixin(Provider):
     def max_programmable_tx_commands(self) -> int:
         """Return maximum transaction commands."""
         return int(
-            self._protocol.attributes["max_programmable_tx_commands"]["u32"]
+            self.protocol.attributes["max_programmable_tx_commands"]["u32"]
         )
 
     @versionadded(
@@ -445,7 +776,7 @@ class _ClientMixin(Provider):
     @property
     def max_pure_argument_size(self) -> int:
         """Return maximum transaction commands."""
-        return int(self._protocol.attributes["max_pure_argument_size"]["u32"])
+        return int(self.protocol.attributes["max_pure_argument_size"]["u32"])
 
     @versionadded(
         version="0.29.0", reason="Added constraint for RPC sfetches."
@@ -453,7 +784,7 @@ class _ClientMixin(Provider):
     @property
     def max_tx_size_bytes(self) -> int:
         """Return maximum transaction commands."""
-        return int(self._protocol.attributes["max_tx_size_bytes"]["u64"])
+        return int(self.protocol.attributes["max_tx_size_bytes"]["u64"])
 
     @versionadded(
         version="0.29.0", reason="Added constraint for RPC sfetches."
@@ -461,7 +792,7 @@ class _ClientMixin(Provider):
     @property
     def max_type_argument_depth(self) -> int:
         """Return maximum transaction commands."""
-        return int(self._protocol.attributes["max_type_argument_depth"]["u32"])
+        return int(self.protocol.attributes["max_type_argument_depth"]["u32"])
 
     @versionadded(
         version="0.29.0", reason="Added constraint for RPC sfetches."
@@ -469,4 +800,4 @@ class _ClientMixin(Provider):
     @property
     def max_type_arguments(self) -> int:
         """Return maximum transaction commands."""
-        return int(self._protocol.attributes["max_type_arguments"]["u32"])
+        return int(self.protocol.attributes["max_type_arguments"]["u32"])
@@ -14,10 +14,12 @@
 
 """Sui Synchronous RPC Client module."""
 
+import base64
 import logging
+import threading
+from concurrent.futures import Future
 from typing import Any, Optional, Union
 from json import JSONDecodeError
-import ssl
 import httpx
 from deprecated.sphinx import versionchanged, versionadded, deprecated
 from pysui import (
@@ -28,7 +30,15 @@ from pysui import (
     SuiAddress,
     SuiConfig,
 )
-from pysui.sui.sui_clients.common import _ClientMixin
+from pysui.sui.sui_clients._deprecated_sync import DeprecatedTxnMixin
+from pysui.sui.sui_clients.common import (
+    _ClientMixin,
+    _exception_data,
+    _json_bytes,
+    _json_loads,
+    _SSL_CONTEXT,
+    _warn_deprecated,
+)
 
 from pysui.sui.sui_crypto import MultiSig, SuiPublicKey
 from pysui.sui.sui_types.scalars import (
@@ -36,17 +46,32 @@ from pysui.sui.sui_types.scalars import (
     SuiSignature,
     SuiTxBytes,
     SuiString,
+    SuiU8,
+    SuiU16,
+    SuiU32,
+    SuiU64,
+    SuiU128,
+    SuiU256,
 )
+from pysui.sui.sui_types import bcs
 from pysui.sui.sui_types.collections import SuiArray, SuiMap
 from pysui.sui.sui_txresults.single_tx import (
     FaucetGasRequest,
+    ObjectRead,
     ObjectReadPage,
-    SuiCoinObjects,
+)
+from pysui.sui.sui_txresults.package_meta import (
+    SuiMoveParameterType,
+    SuiMoveScalarArgument,
+    SuiMoveVector,
+    SuiParameterReference,
+    SuiParameterStruct,
 )
 from pysui.sui.sui_builders.base_builder import SuiBaseBuilder, SuiRequestType
 from pysui.sui.sui_builders.get_builders import (
     GetCoinTypeBalance,
     GetCoins,
+    GetFunction,
     GetMultipleObjects,
     GetPastObject,
     GetObjectsOwnedByAddress,
@@ -68,7 +93,6 @@ from pysui.sui.sui_builders.exec_builders import (
     MoveCall,
     Publish,
 )
-from pysui.sui.sui_utils import partition
 
 # Standard library logging setup
 logger = logging.getLogger("pysui.sync_client")
@@ -77,23 +101,254 @@ if not logging.getLogger().handlers:
     logger.propagate = False
 
 
-class SuiClient(_ClientMixin):
+# Legacy MoveCall argument converters by Move scalar type
+_LEGACY_SCALARS: dict[str, Any] = {
+    "Bool": lambda value: str(value).lower() == "true",
+    "U8": SuiU8,
+    "U16": SuiU16,
+    "U32": SuiU32,
+    "U64": SuiU64,
+    "U128": SuiU128,
+    "U256": SuiU256,
+    "Address": lambda value: bcs.Address.from_str(str(value)),
+}
+# Move structs passed by value as pure arguments
+_LEGACY_PURE_STRUCTS: frozenset[str] = frozenset(
+    ("0x1::string::String", "0x1::ascii::String", "0x2::object::ID")
+)
+
+
+def _legacy_struct_name(parameter: SuiParameterStruct) -> str:
+    """Struct name with a short address, e.g. 0x1::string::String."""
+    address = hex(int(parameter.address, 16))
+    return f"{address}::{parameter.module}::{parameter.name}"
+
+
+def _legacy_type_name(move_type: Any, type_arguments: list[str]) -> str:
+    """Move type name of a parameter type, e.g. vector<u8>."""
+    if isinstance(move_type, SuiMoveParameterType):
+        return type_arguments[move_type.type_parameters_index]
+    if isinstance(move_type, SuiMoveScalarArgument):
+        move_type = move_type.scalar_type
+    if isinstance(move_type, str):
+        return move_type.lower()
+    if isinstance(move_type, SuiMoveVector):
+        inner = _legacy_type_name(move_type.vector_of, type_arguments)
+        return f"vector<{inner}>"
+    if isinstance(move_type, SuiParameterStruct):
+        name = _legacy_struct_name(move_type)
+        if move_type.type_arguments:
+            inner = ", ".join(
+                _legacy_type_name(type_arg, type_arguments)
+                for type_arg in move_type.type_arguments
+            )
+            name = f"{name}<{inner}>"
+        return name
+    raise ValueError(f"bulk_execute can not name Move type {move_type}")
+
+
+def _legacy_struct_argument(parameter: SuiParameterStruct, value: Any) -> Any:
+    """Convert a legacy argument for a struct passed by value."""
+    if _legacy_struct_name(parameter) not in _LEGACY_PURE_STRUCTS:
+        return ObjectID(str(value))
+    if parameter.name == "ID":
+        return bcs.Address.from_str(str(value))
+    return str(value)
+
+
+@versionadded(
+    version="0.29.1", reason="Resolve legacy MoveCall arguments by signature."
+)
+def _legacy_move_argument(
+    txn: Any, parameter: Any, type_arguments: list[str], value: Any
+) -> Any:
+    """Convert a legacy MoveCall argument by its Move parameter type.
+
+    The legacy builders pass arguments as JSON values the RPC node resolved
+    against the function signature. This does the same for a SuiTransaction:
+    scalars, strings and IDs become pure values, other structs and
+    references become objects.
+    """
+    value = value.array if isinstance(value, SuiArray) else value
+    value = value.value if isinstance(value, SuiString) else value
+    if isinstance(parameter, SuiMoveParameterType):
+        type_arg = type_arguments[parameter.type_parameters_index]
+        if type_arg.capitalize() in _LEGACY_SCALARS:
+            return _LEGACY_SCALARS[type_arg.capitalize()](value)
+        return ObjectID(str(value))
+    if isinstance(parameter, SuiMoveScalarArgument):
+        parameter = parameter.scalar_type
+    if isinstance(parameter, str) and parameter in _LEGACY_SCALARS:
+        return _LEGACY_SCALARS[parameter](value)
+    if isinstance(parameter, SuiParameterReference):
+        return ObjectID(str(value))
+    if isinstance(parameter, SuiParameterStruct):
+        return _legacy_struct_argument(parameter, value)
+    if isinstance(parameter, SuiMoveVector) and isinstance(value, (list, str)):
+        element = parameter.vector_of
+        if isinstance(element, SuiMoveScalarArgument):
+            element = element.scalar_type
+        if element == "U8" and isinstance(value, str):
+            value = list(value.encode("utf-8"))
+        if isinstance(element, str) and element in _LEGACY_SCALARS:
+            return [_LEGACY_SCALARS[element](item) for item in value]
+        if isinstance(element, SuiParameterStruct) and isinstance(value, list):
+            if _legacy_struct_name(element) in _LEGACY_PURE_STRUCTS:
+                return [
+                    _legacy_struct_argument(element, item) for item in value
+                ]
+            if value:
+                return txn.make_move_vector(
+                    [ObjectID(str(item)) for item in value]
+                )
+            # An empty vector has no item to take its type from
+            return txn.builder.make_move_vector(
+                bcs.OptionalTypeTag(
+                    bcs.TypeTag.type_tag_from(
+                        _legacy_type_name(element, type_arguments)
+                    )
+                ),
+                [],
+            )
+    raise ValueError(f"bulk_execute can not convert argument {value}")
+
+
+@versionadded(
+    version="0.29.1", reason="Coalesce concurrent requests into batches."
+)
+class _BatchDispatcher:
+    """Coalesces requests from concurrent callers into JSON-RPC batches.
+
+    A request made while no other is queued or in flight is sent at once,
+    so a single threaded caller sees no added latency. Otherwise the first
+    request queued arms a timer for the batch window. When it expires, or
+    when the queue reaches the batch size, the queued requests are sent in
+    one batch request and each caller is given its result.
+    """
+
+    def __init__(
+        self, client: "SuiClient", window_ms: float, max_batch: int
+    ) -> None:
+        """Initialize dispatcher for client."""
+        self._client = client
+        self._window = window_ms / 1000.0
+        self._max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: list[tuple[SuiBaseBuilder, Future]] = []
+        self._in_flight: int = 0
+        self._timer: threading.Timer = None
+
+    def submit(self, builder: SuiBaseBuilder) -> SuiRpcResult:
+        """Queue the builder and wait for its result."""
+        # Validate in the caller so builder errors are raised to it alone
+        self._client._validate_builder(builder)
+        future: Future = Future()
+        batch = None
+        with self._lock:
+            self._pending.append((builder, future))
+            if len(self._pending) >= self._max_batch or (
+                len(self._pending) == 1 and not self._in_flight
+            ):
+                batch = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch:
+            self._dispatch(batch)
+        return future.result()
+
+    def _take(self) -> list[tuple[SuiBaseBuilder, Future]]:
+        """Take the queued requests and disarm the timer, lock held."""
+        batch = self._pending
+        self._pending = []
+        self._in_flight += len(batch)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self) -> None:
+        """Send what is queued when the batch window expires."""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: list[tuple[SuiBaseBuilder, Future]]) -> None:
+        """Send the requests and hand each caller its result."""
+        try:
+            if len(batch) == 1:
+                results = [self._client._execute_request(batch[0][0])]
+            else:
+                results = self._client._execute_batch(
+                    [builder for builder, _ in batch]
+                )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for _, future in batch:
+                future.set_exception(exc)
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        finally:
+            with self._lock:
+                self._in_flight -= len(batch)
+
+
+class SuiClient(DeprecatedTxnMixin, _ClientMixin):
     """Sui Syncrhonous Client."""
 
+    _RPC_BATCH_LIMIT: int = 50
+
     @versionchanged(version="0.28.0", reason="Added logging")
+    @versionchanged(
+        version="0.29.1", reason="Explicit connection pool and TLS context."
+    )
+    @versionchanged(
+        version="0.29.1",
+        reason="Gas price and protocol config fetched in background.",
+    )
+    @versionchanged(
+        version="0.29.1", reason="Optional batching of concurrent requests."
+    )
     def __init__(
         self,
         config: SuiConfig,
         request_type: SuiRequestType = SuiRequestType.WAITFORLOCALEXECUTION,
+        batch_window_ms: Optional[float] = None,
     ) -> None:
-        """Client initializer."""
+        """Client initializer.
+
+        :param config: The client configuration
+        :type config: SuiConfig
+        :param request_type: Transaction execution request type, defaults to
+            SuiRequestType.WAITFORLOCALEXECUTION
+        :type request_type: SuiRequestType, optional
+        :param batch_window_ms: When set, requests made while another is in
+            flight are queued for up to this many milliseconds and sent in
+            one JSON-RPC batch request of at most `_RPC_BATCH_LIMIT`
+            requests, defaults to None (each request is sent on its own)
+        :type batch_window_ms: Optional[float], optional
+        """
         super().__init__(config, request_type)
         self._client = httpx.Client(
-            http2=True,
-            timeout=120.0,
-            verify=ssl.SSLContext(ssl.PROTOCOL_SSLv23),
+            timeout=self._HTTP_TIMEOUT,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                verify=_SSL_CONTEXT,
+                limits=self._HTTP_LIMITS,
+                retries=self._HTTP_RETRIES,
+            ),
         )
-        self._fetch_common_descriptors()
+        self._faucet_client: httpx.Client = None
+        self._faucet_lock: threading.Lock = threading.Lock()
+        self._dispatcher: _BatchDispatcher = (
+            _BatchDispatcher(self, batch_window_ms, self._RPC_BATCH_LIMIT)
+            if batch_window_ms
+            else None
+        )
+        self._fetch_rpc_api()
+        self._prefetch_common_descriptors(logger)
         logger.info(f"Initialized synchronous client for {config.rpc_url}")
 
     @property
@@ -101,28 +356,57 @@ class SuiClient(_ClientMixin):
         """Return whether client is syncrhonous (True) or not (False)."""
         return True
 
+    @versionadded(
+        version="0.29.1", reason="Stream RPC responses into one buffer."
+    )
+    def _post_rpc(self, headers: dict, content: bytes) -> Any:
+        """Post the serialized RPC payload and decode the JSON response.
+
+        The response body is streamed into a single buffer and decoded from there,
+        avoiding the intermediate chunk list and joined copy of a fully read response.
+        """
+        with self._client.stream(
+            "POST",
+            self.config.rpc_url,
+            headers=headers,
+            content=content,
+        ) as response:
+            body = bytearray()
+            for chunk in response.iter_bytes():
+                body.extend(chunk)
+        return _json_loads(body)
+
     @versionchanged(
         version="0.28.0", reason="Consolidated exception handling."
     )
+    @versionchanged(version="0.29.1", reason="Use orjson for RPC payloads.")
     def _execute(
         self, builder: SuiBaseBuilder
     ) -> Union[SuiRpcResult, Exception]:
         """Execute the builder construct."""
+        if self._dispatcher is not None:
+            return self._dispatcher.submit(builder)
+        return self._execute_request(builder)
+
+    @versionadded(
+        version="0.29.1", reason="Split from _execute for batch dispatch."
+    )
+    def _execute_request(
+        self, builder: SuiBaseBuilder
+    ) -> Union[SuiRpcResult, Exception]:
+        """Send the builder construct request on its own."""
         # Validate builder and send request
         try:
-            result = self._client.post(
-                self.config.rpc_url,
-                headers=builder.header,
-                json=self._validate_builder(builder),
-            )
             return SuiRpcResult(
                 True,
                 None,
-                result.json(),
+                self._post_rpc(
+                    builder.header, self._validated_content(builder)
+                ),
             )
         except JSONDecodeError as jexc:
             return SuiRpcResult(
-                False, f"JSON Decoder Error {jexc.msg}", vars(jexc)
+                False, f"JSON Decoder Error {jexc.msg}", _exception_data(jexc)
             )
         except (
             httpx.HTTPError,
@@ -130,9 +414,76 @@ class SuiClient(_ClientMixin):
             httpx.CookieConflict,
         ) as hexc:
             return SuiRpcResult(
-                False, f"HTTPX error: {hexc.__class__.__name__}", vars(hexc)
+                False,
+                f"HTTPX error: {hexc.__class__.__name__}",
+                _exception_data(hexc),
             )
 
+    @versionadded(version="0.29.1", reason="Support JSON-RPC batch requests.")
+    def _execute_batch(
+        self, builders: list[SuiBaseBuilder]
+    ) -> list[SuiRpcResult]:
+        """Execute the builder constructs in JSON-RPC batch requests.
+
+        Builders are sent in batch requests of at most `_RPC_BATCH_LIMIT` requests each. Results
+        are returned in the same order as builders, each as it would be from `_execute`.
+        """
+        limit = self._RPC_BATCH_LIMIT
+        results: list[SuiRpcResult] = []
+        for index in range(0, len(builders), limit):
+            results.extend(self._post_batch(builders[index : index + limit]))
+        return results
+
+    @versionadded(
+        version="0.29.1", reason="Split from _execute_batch per batch request."
+    )
+    def _post_batch(
+        self, builders: list[SuiBaseBuilder]
+    ) -> list[SuiRpcResult]:
+        """Execute the builder constructs in one JSON-RPC batch request."""
+        # Validate builders, each request in batch is identified by its index
+        payload: list[dict] = []
+        for index, builder in enumerate(builders):
+            jblock = dict(self._validate_builder(builder))
+            jblock["id"] = index
+            payload.append(jblock)
+        try:
+            result = self._post_rpc(builders[0].header, _json_bytes(payload))
+        except JSONDecodeError as jexc:
+            return [
+                SuiRpcResult(
+                    False,
+                    f"JSON Decoder Error {jexc.msg}",
+                    _exception_data(jexc),
+                )
+            ] * len(builders)
+        except (
+            httpx.HTTPError,
+            httpx.InvalidURL,
+            httpx.CookieConflict,
+        ) as hexc:
+            return [
+                SuiRpcResult(
+                    False,
+                    f"HTTPX error: {hexc.__class__.__name__}",
+                    _exception_data(hexc),
+                )
+            ] * len(builders)
+        # A non-array reply is an error for the batch as a whole
+        if not isinstance(result, list):
+            return [SuiRpcResult(True, None, result)] * len(builders)
+        by_id: dict = {response.get("id"): response for response in result}
+        return [
+            (
+                SuiRpcResult(True, None, by_id[index])
+                if index in by_id
+                else SuiRpcResult(
+                    False, f"No batch response for request {index}"
+                )
+            )
+            for index in range(len(builders))
+        ]
+
     def execute(
         self,
         builder: SuiBaseBuilder,
@@ -140,20 +491,188 @@ class SuiClient(_ClientMixin):
     ) -> Union[SuiRpcResult, Exception]:
         """Execute the builder construct."""
         if not builder.txn_required:
-            result = self._execute(builder)
-            if result.is_ok():
-                if "error" in result.result_data:
+            return self._builder_result(builder, self._execute(builder))
+        return self._multi_signed_execution(builder, additional_signatures)
+
+    @versionadded(
+        version="0.29.1", reason="Execute many builders per round trip."
+    )
+    def execute_batch(
+        self, builders: list[SuiBaseBuilder]
+    ) -> list[SuiRpcResult]:
+        """execute_batch Execute builders with JSON-RPC batch requests.
+
+        All builders are sent in batch requests of at most
+        `_RPC_BATCH_LIMIT` requests. The transaction bytes returned for
+        transaction builders are then signed by each builder's authority
+        and executed in the same way.
+
+        Transactions in one batch are built against the same object
+        versions. A transaction that uses a gas object or an owned input
+        also used by an earlier transaction of the batch is therefore
+        executed on its own, as with `execute`, after the batch.
+
+        :param builders: The builders to execute
+        :type builders: list[SuiBaseBuilder]
+        :return: A result for each builder, in the order of builders, as
+            `execute` would have returned it. A failure to sign a
+            transaction is returned as that builder's result.
+        :rtype: list[SuiRpcResult]
+        """
+        if not builders:
+            return []
+        results, pending, deferred = self._prepare_batch_execution(
+            builders, self._execute_batch(builders)
+        )
+        if pending:
+            exec_builders = [exec_builder for _, exec_builder in pending]
+            for (index, exec_builder), result in zip(
+                pending, self._execute_batch(exec_builders)
+            ):
+                results[index] = self._builder_result(exec_builder, result)
+        for index in deferred:
+            try:
+                results[index] = self.execute(builders[index])
+            # pylint: disable=broad-exception-caught
+            except Exception as exc:
+                results[index] = SuiRpcResult(
+                    False, f"Execution failed: {exc}", _exception_data(exc)
+                )
+        return results
+
+    @versionadded(
+        version="0.29.1",
+        reason="Compose legacy transaction builders into one transaction.",
+    )
+    def bulk_execute(
+        self, builders: list[Union[SplitCoinEqually, MoveCall, Publish]]
+    ) -> SuiRpcResult:
+        """bulk_execute Execute legacy builders as one programmable transaction.
+
+        Each SplitCoinEqually, MoveCall and Publish builder becomes the
+        matching command of a single SuiTransaction, in list order, which
+        is then signed and executed once. The UpgradeCap of a published
+        package is transferred to the sender, as the legacy publish did.
+        Coins are split with their own coin type and MoveCall arguments are
+        converted to pure values or objects by the function's parameter
+        types, as the RPC node did for the legacy builders.
+        The builders' `gas` objects are not used and the gas budget is the
+        sum of the builders' gas budgets.
+
+        :param builders: The builders to compose, all with the same signer
+        :type builders: list[Union[SplitCoinEqually, MoveCall, Publish]]
+        :raises ValueError: If builders is empty, a builder is not one of the
+            supported types, builders have different signers, a split object
+            is not a coin or a MoveCall argument can not be converted for its
+            parameter type
+        :return: Result of the single transaction execution
+        :rtype: SuiRpcResult
+        """
+        # pylint: disable=import-outside-toplevel
+        from pysui.sui.sui_clients.transaction import SuiTransaction
+
+        if not builders:
+            raise ValueError("bulk_execute requires at least one builder")
+        for builder in builders:
+            if not isinstance(builder, (SplitCoinEqually, MoveCall, Publish)):
+                raise ValueError(
+                    "bulk_execute does not support "
+                    f"{builder.__class__.__name__}"
+                )
+        signers = {
+            str(
+                builder.sender
+                if isinstance(builder, Publish)
+                else builder.signer
+            )
+            for builder in builders
+        }
+        if len(signers) != 1:
+            raise ValueError("bulk_execute builders must share one signer")
+        sender = SuiAddress(signers.pop())
+        # Fetch the coins split at once, their type is the split's type
+        split_coins = [
+            builder.coin_object_id
+            for builder in builders
+            if isinstance(builder, SplitCoinEqually)
+        ]
+        coins = iter([])
+        if split_coins:
+            result = self.get_objects_for(split_coins)
+            if result.is_err():
+                return result
+            coins = iter(result.result_data)
+        txn = SuiTransaction(self, initial_sender=sender)
+        # MoveCall target parameter types, fetched once per target
+        parameters: dict[str, list] = {}
+        gas_budget = 0
+        for builder in builders:
+            if isinstance(builder, SplitCoinEqually):
+                coin = next(coins)
+                if not isinstance(coin, ObjectRead):
                     return SuiRpcResult(
-                        False, result.result_data["error"], None
+                        False, f"Coin {builder.coin_object_id} not found"
                     )
-                # print(result.result_data)
-                return SuiRpcResult(
-                    True,
-                    None,
-                    builder.handle_return(result.result_data["result"]),
+                if not (
+                    coin.object_type.startswith("0x2::coin::Coin<")
+                    and coin.object_type.endswith(">")
+                ):
+                    raise ValueError(
+                        f"{builder.coin_object_id} is not a coin, "
+                        f"found type {coin.object_type}"
+                    )
+                txn.split_coin_equal(
+                    coin=coin,
+                    split_count=int(builder.split_count.value),
+                    coin_type=coin.object_type[len("0x2::coin::Coin<") : -1],
                 )
-            return result
-        return self._multi_signed_execution(builder, additional_signatures)
+            elif isinstance(builder, MoveCall):
+                target = (
+                    f"{builder.package_object_id}::"
+                    f"{builder.module}::{builder.function}"
+                )
+                type_arguments = [
+                    str(type_arg) for type_arg in builder.type_arguments.array
+                ]
+                if target not in parameters:
+                    result = self.execute(
+                        GetFunction(
+                            package=builder.package_object_id,
+                            module_name=builder.module,
+                            function_name=builder.function,
+                        )
+                    )
+                    if result.is_err():
+                        return result
+                    parameters[target] = result.result_data.parameters
+                if len(builder.arguments.array) > len(parameters[target]):
+                    raise ValueError(f"Too many arguments for {target}")
+                txn.move_call(
+                    target=target,
+                    arguments=[
+                        _legacy_move_argument(
+                            txn, parameter, type_arguments, argument
+                        )
+                        for parameter, argument in zip(
+                            parameters[target], builder.arguments.array
+                        )
+                    ],
+                    type_arguments=type_arguments,
+                )
+            else:
+                upgrade_cap = txn.builder.publish(
+                    [
+                        list(base64.b64decode(str(module)))
+                        for module in builder.compiled_modules.array
+                    ],
+                    [
+                        bcs.Address.from_str(str(dependency))
+                        for dependency in builder.dependencies.array
+                    ],
+                )
+                txn.transfer_objects(transfers=[upgrade_cap], recipient=sender)
+            gas_budget += int(builder.gas_budget.value)
+        return txn.execute(gas_budget=str(gas_budget))
 
     def execute_no_sign(
         self, builder: SuiBaseBuilder
@@ -162,17 +681,16 @@ class SuiClient(_ClientMixin):
         if builder.txn_required:
             result = self._execute(builder)
             if result.is_ok():
-                result = result.result_data
-                if "error" in result:
-                    return SuiRpcResult(
-                        False, result["error"]["message"], None
-                    )
+                data: dict = result.result_data
+                error = data.get("error")
+                if error:
+                    return SuiRpcResult(False, error["message"], None)
                 result = SuiRpcResult(
                     True,
                     None,
                     PreExecutionResult(
                         builder.authority,
-                        builder.handle_return(result["result"]),
+                        builder.handle_return(data["result"]),
                     ),
                 )
             return result
@@ -199,10 +717,12 @@ class SuiClient(_ClientMixin):
                 if isinstance(new_sig, SuiSignature):
                     sig_array = [new_sig]
                     if signers:
+                        raw_bytes = tx_bytes.tx_bytes
+                        keypair_for = self.config.keypair_for_address
                         sig_array.extend(
                             [
-                                kpair.new_sign_secure(tx_bytes)
-                                for kpair in signers.array
+                                keypair_for(addy).new_sign_secure(raw_bytes)
+                                for addy in signers.array
                             ]
                         )
                     exec_tx = ExecuteTransaction(
@@ -232,28 +752,14 @@ class SuiClient(_ClientMixin):
         :return: Result of execution
         :rtype: Union[SuiRpcResult, Exception]
         """
-        signers_list = []
-        signers_list.append(self.config.keypair_for_address(signer))
-        if additional_signatures:
-            for addy in additional_signatures.array:
-                signers_list.append(self.config.keypair_for_address(addy))
         builder = ExecuteTransaction(
             tx_bytes=tx_bytes,
-            signatures=SuiArray(
-                [
-                    kpair.new_sign_secure(tx_bytes.tx_bytes)
-                    for kpair in signers_list
-                ]
+            signatures=self._sign_tx_bytes(
+                tx_bytes, signer, additional_signatures
             ),
             request_type=self.request_type,
         )
-        result = self._execute(builder)
-        if result.is_ok() and "error" not in result.result_data:
-            # print(result.result_data["result"])
-            result = SuiRpcResult(
-                True, None, builder.handle_return(result.result_data["result"])
-            )
-        return result
+        return self._builder_result(builder, self._execute(builder))
 
     def dry_run(
         self, builder: SuiBaseBuilder
@@ -270,28 +776,31 @@ class SuiClient(_ClientMixin):
             False, "dry_run is used only with transaction types"
         )
 
+    @versionchanged(
+        version="0.29.1",
+        reason="Submit and execute without intermediate result wrapping.",
+    )
     def _multi_signed_execution(
         self,
         builder: SuiBaseBuilder,
         additional_signers: SuiArray[SuiAddress] = None,
     ) -> Union[SuiRpcResult, Exception]:
-        """."""
-        result = self.execute_no_sign(builder)
-        if result.is_ok():
-            exec_builder = self.sign_for_execution(
-                result.result_data.tx_bytes, builder, additional_signers
-            )
-            result = self._execute(exec_builder)
-            if result.is_ok() and "error" not in result.result_data:
-                # print(result.result_data["result"])
-                result = SuiRpcResult(
-                    True,
-                    None,
-                    exec_builder.handle_return(result.result_data["result"]),
-                )
-            else:
-                result = SuiRpcResult(False, result.result_data["error"])
-        return result
+        """Submit the transaction builder, sign the resulting bytes and execute.
+
+        Only the transaction bytes are taken from the submission response, the
+        full `TransactionBytes` result is not decoded.
+        """
+        result = self._execute(builder)
+        if not result.is_ok():
+            return result
+        data: dict = result.result_data
+        error = data.get("error")
+        if error:
+            return SuiRpcResult(False, error["message"], None)
+        exec_builder = self.sign_for_execution(
+            SuiTxBytes(data["result"]["txBytes"]), builder, additional_signers
+        )
+        return self._builder_result(exec_builder, self._execute(exec_builder))
 
     # Build and execute convenience methods
 
@@ -299,6 +808,10 @@ class SuiClient(_ClientMixin):
         version="0.28.0",
         reason="Support for > RPC provider limits of coin objects for owner.",
     )
+    @versionchanged(
+        version="0.29.1",
+        reason="Accumulate fetch_all pages into one presized list.",
+    )
     def _get_coins_for_type(
         self,
         *,
@@ -321,28 +834,61 @@ class SuiClient(_ClientMixin):
         )
         if result.is_ok():
             limit: int = result.result_data.coin_object_count
-            builder = GetCoins(owner=address, coin_type=coin_type)
             if limit > self.max_gets and fetch_all:
-                accumer: list = []
-                gasses = handle_result(self.execute(builder))
-                accumer.extend(gasses.data)
-                while gasses.next_cursor:
-                    builder.cursor = gasses.next_cursor
-                    gasses = handle_result(self.execute(builder))
-                    accumer.extend(gasses.data)
-                result = SuiRpcResult(
-                    True,
-                    "",
-                    SuiCoinObjects.from_dict(
-                        {"data": accumer, "next_cursor": None}
-                    ),
+                result = self._fetch_all_coin_pages(
+                    address=address, coin_type=coin_type, expected=limit
                 )
             # if < 50 or > 50 and fetch_all false
             # legacy behavior
             else:
-                result = self.execute(builder)
+                result = self.execute(
+                    GetCoins(owner=address, coin_type=coin_type)
+                )
         return result
 
+    def _fetch_all_coin_pages(
+        self, *, address: SuiAddress, coin_type: SuiString, expected: int
+    ) -> SuiRpcResult:
+        """_fetch_all_coin_pages Walks all GetCoins pages for address and coin_type.
+
+        :param address: The address to fetch coins of coin_type for
+        :type address: SuiAddress
+        :param coin_type: Fully qualified type names for the coin
+        :type coin_type: SuiString
+        :param expected: Coin object count reported by balance, used to presize the accumulator
+        :type expected: int
+        :return: If successful, result contains an array of all coins objects of coin_type found
+        :rtype: SuiRpcResult
+        """
+        builder = GetCoins(owner=address, coin_type=coin_type)
+        accumer: list = [None] * expected
+        index: int = 0
+        page_builder: GetCoins = builder
+        while page_builder:
+            result = self._execute(page_builder)
+            if result.is_err():
+                return result
+            if "error" in result.result_data:
+                return SuiRpcResult(False, result.result_data["error"], None)
+            page: dict = result.result_data["result"]
+            page_len = len(page["data"])
+            accumer[index : index + page_len] = page["data"]
+            index += page_len
+            page_builder = None
+            if page["nextCursor"] and page.get("hasNextPage", True):
+                page_builder = GetCoins(
+                    owner=address,
+                    coin_type=coin_type,
+                    cursor=ObjectID(page["nextCursor"]),
+                )
+        # Coin count may have changed since the balance was fetched
+        del accumer[index:]
+        return SuiRpcResult(
+            True,
+            "",
+            builder.handle_return({"data": accumer, "nextCursor": None}),
+        )
+
     @versionadded(
         version="0.26.1",
         reason="Implement closing underlying httpx transport.",
@@ -353,8 +899,24 @@ class SuiClient(_ClientMixin):
         Does not usually need to be called but put in place as part of commingling with websocket activity.
         """
         self._client.close()
+        if self._faucet_client:
+            self._faucet_client.close()
         self._transport_open = False
 
+    @versionadded(
+        version="0.29.1", reason="Client usable as a context manager."
+    )
+    def __enter__(self) -> "SuiClient":
+        """Enter the client context."""
+        return self
+
+    @versionadded(
+        version="0.29.1", reason="Client usable as a context manager."
+    )
+    def __exit__(self, *exc_info) -> None:
+        """Close the client's connections on leaving the context."""
+        self.close()
+
     @versionchanged(
         version="0.28.0",
         reason="Added fetch_all as currently limited by RPC providers results",
@@ -402,6 +964,29 @@ class SuiClient(_ClientMixin):
             address=address, coin_type=coin_type, fetch_all=fetch_all
         )
 
+    @versionadded(
+        version="0.29.1",
+        reason="Dedicated faucet connection, created on first use.",
+    )
+    def _get_faucet_client(self) -> httpx.Client:
+        """Return the faucet client, creating it on first use.
+
+        The faucet is usually a different host than the RPC url so it keeps its own connection alive.
+        Creation is locked so concurrent first callers share one client.
+        """
+        with self._faucet_lock:
+            if self._faucet_client is None:
+                self._faucet_client = httpx.Client(
+                    timeout=self._HTTP_TIMEOUT,
+                    transport=httpx.HTTPTransport(
+                        http2=True,
+                        verify=_SSL_CONTEXT,
+                        limits=self._FAUCET_LIMITS,
+                        retries=self._HTTP_RETRIES,
+                    ),
+                )
+        return self._faucet_client
+
     def get_gas_from_faucet(self, for_address: SuiAddress = None) -> Any:
         """get_gas_from_faucet Gets gas from SUI faucet.
 
@@ -413,11 +998,17 @@ class SuiClient(_ClientMixin):
         """
         for_address = for_address or self.config.active_address
         try:
-            result = self._client.post(
-                self.config.faucet_url,
-                headers=GetObjectsOwnedByAddress(for_address).header,
-                json={"FixedAmountRequest": {"recipient": f"{for_address}"}},
-            ).json()
+            result = (
+                self._get_faucet_client()
+                .post(
+                    self.config.faucet_url,
+                    headers=GetObjectsOwnedByAddress(for_address).header,
+                    json={
+                        "FixedAmountRequest": {"recipient": f"{for_address}"}
+                    },
+                )
+                .json()
+            )
             if result["error"] is None:
                 return SuiRpcResult(
                     True, None, FaucetGasRequest.from_dict(result)
@@ -425,13 +1016,18 @@ class SuiClient(_ClientMixin):
             return SuiRpcResult(False, result["error"])
         except JSONDecodeError as jexc:
             return SuiRpcResult(
-                False, f"JSON Decoder Error {jexc.msg}", vars(jexc)
+                False, f"JSON Decoder Error {jexc.msg}", _exception_data(jexc)
             )
         except httpx.ReadTimeout as hexc:
-            return SuiRpcResult(False, "HTTP read timeout error", vars(hexc))
+            return SuiRpcResult(
+                False, "HTTP read timeout error", _exception_data(hexc)
+            )
         except TypeError as texc:
-            return SuiRpcResult(False, "Type error", vars(texc))
+            return SuiRpcResult(False, "Type error", _exception_data(texc))
 
+    @versionchanged(
+        version="0.29.1", reason="Immutable results are cached per client."
+    )
     def get_object(
         self, identifier: ObjectID, version: SuiInteger = None
     ) -> Union[SuiRpcResult, Exception]:
@@ -444,11 +1040,17 @@ class SuiClient(_ClientMixin):
         :return: The objeect's ObjectRead data
         :rtype: Union[SuiRpcResult, Exception]
         """
-        return self.execute(
-            GetObject(object_id=identifier)
-            if version is None
-            else GetPastObject(identifier, version)
-        )
+        if version is None:
+            return self.execute(GetObject(object_id=identifier))
+        # A specific object version is immutable
+        key = ("object", str(identifier), str(version))
+        result = self._cached_result(key)
+        if result is None:
+            result = self.execute(GetPastObject(identifier, version))
+            self._cache_result(
+                key, result, isinstance(result.result_data, ObjectRead)
+            )
+        return result
 
     @versionchanged(
         version="0.28.0",
@@ -498,6 +1100,10 @@ class SuiClient(_ClientMixin):
         version="0.29.0",
         reason="Handles large identifier list",
     )
+    @versionchanged(
+        version="0.29.1",
+        reason="Large identifier list chunks are fetched in one batch request",
+    )
     def get_objects_for(
         self, identifiers: list[ObjectID]
     ) -> Union[SuiRpcResult, Exception]:
@@ -510,21 +1116,34 @@ class SuiClient(_ClientMixin):
         :returns: A list of object data
         :rtype: SuiRpcResult
         """
-        # Revert to new multiOp
-        builder = GetMultipleObjects(object_ids=[])
         # Handle large list
         if len(identifiers) > self.max_gets:
             accum: list = []
-            for chunk in list(partition(identifiers, self.max_gets)):
-                builder.object_ids = chunk
-                accum.extend(handle_result(self.execute(builder)))
+            # Chunks are independent, send a builder per chunk in batches
+            max_gets = self.max_gets
+            builders = [
+                GetMultipleObjects(
+                    object_ids=identifiers[index : index + max_gets]
+                )
+                for index in range(0, len(identifiers), max_gets)
+            ]
+            # Any failed chunk fails the whole call
+            for builder, chunk_result in zip(
+                builders, self._execute_batch(builders)
+            ):
+                chunk_result = self._builder_result(builder, chunk_result)
+                if chunk_result.is_err():
+                    return chunk_result
+                accum.extend(chunk_result.result_data)
             result = SuiRpcResult(True, None, accum)
         else:
-            builder.object_ids = identifiers
-            result = self.execute(builder)
+            result = self.execute(GetMultipleObjects(object_ids=identifiers))
 
         return result
 
+    @versionchanged(
+        version="0.29.1", reason="Immutable results are cached per client."
+    )
     def get_package(
         self, package_id: ObjectID
     ) -> Union[SuiRpcResult, Exception]:
@@ -537,7 +1156,13 @@ class SuiClient(_ClientMixin):
         :returns: The package detail data
         :rtype: SuiRpcResult
         """
-        result = self.execute(GetPackage(package=package_id))
+        # Packages are immutable once published
+        key = ("package", str(package_id))
+        result = self._cached_result(key)
+        if result is None:
+            result = self._cache_result(
+                key, self.execute(GetPackage(package=package_id))
+            )
         return result
 
     def get_events(
@@ -561,9 +1186,14 @@ class SuiClient(_ClientMixin):
         :return: API call result
         :rtype: SuiRpcResult
         """
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(QueryEvents(**inargs))
+        return self.execute(
+            QueryEvents(
+                query=query,
+                cursor=cursor,
+                limit=limit,
+                descending_order=descending_order,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def pay_txn(
@@ -595,10 +1225,17 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: pay_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(Pay(**inargs))
+        _warn_deprecated(logger, "pay_txn")
+        return self.execute(
+            Pay(
+                signer=signer,
+                input_coins=input_coins,
+                recipients=recipients,
+                amounts=amounts,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def pay_sui_txn(
@@ -627,10 +1264,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: pay_sui_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(PaySui(**inargs))
+        _warn_deprecated(logger, "pay_sui_txn")
+        return self.execute(
+            PaySui(
+                signer=signer,
+                input_coins=input_coins,
+                recipients=recipients,
+                amounts=amounts,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def pay_allsui_txn(
@@ -654,10 +1297,15 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: pay_allsui_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(PayAllSui(**inargs))
+        _warn_deprecated(logger, "pay_allsui_txn")
+        return self.execute(
+            PayAllSui(
+                signer=signer,
+                input_coins=input_coins,
+                recipient=recipient,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def transfer_sui_txn(
@@ -684,10 +1332,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: transfer_sui_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(TransferSui(**inargs))
+        _warn_deprecated(logger, "transfer_sui_txn")
+        return self.execute(
+            TransferSui(
+                signer=signer,
+                sui_object_id=sui_object_id,
+                gas_budget=gas_budget,
+                recipient=recipient,
+                amount=amount,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def transfer_object_txn(
@@ -714,10 +1368,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: transfer_object_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(TransferObject(**inargs))
+        _warn_deprecated(logger, "transfer_object_txn")
+        return self.execute(
+            TransferObject(
+                signer=signer,
+                object_id=object_id,
+                gas=gas,
+                gas_budget=gas_budget,
+                recipient=recipient,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def merge_coin_txn(
@@ -745,10 +1405,16 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: merge_coin_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(MergeCoin(**inargs))
+        _warn_deprecated(logger, "merge_coin_txn")
+        return self.execute(
+            MergeCoin(
+                signer=signer,
+                primary_coin=primary_coin,
+                coin_to_merge=coin_to_merge,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
 
     @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
     def split_coin_txn(
@@ -775,103 +1441,13 @@ class SuiClient(_ClientMixin):
         :return: Result of the transaction
         :rtype: SuiRpcResult
         """
-        logger.warning("using deprecated method: split_coin_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(SplitCoin(**inargs))
-
-    @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
-    def split_coin_equally_txn(
-        self,
-        *,
-        signer: SuiAddress,
-        coin_object_id: ObjectID,
-        split_count: SuiInteger,
-        gas: ObjectID,
-        gas_budget: SuiInteger,
-    ) -> SuiRpcResult:
-        """split_coin_equally_txn invokes `sui_splitCoinEqual` API.
-
-        :param signer: Transaction signer and owner of coin being split
-        :type signer: SuiAddress
-        :param coin_object_id: the coin object to be spilt
-        :type coin_object_id: ObjectID
-        :param split_count: The count of coins to distribute evenly from coin_object_id
-        :type split_count: SuiInteger
-        :param gas: gas object to be used in this transaction
-        :type gas: ObjectID
-        :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
-        :type gas_budget: SuiInteger
-        :return: Result of the transaction
-        :rtype: SuiRpcResult
-        """
-        logger.warning("using deprecated method: split_coin_equally_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(SplitCoinEqually(**inargs))
-
-    @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
-    def move_call_txn(
-        self,
-        *,
-        signer: SuiAddress,
-        package_object_id: ObjectID,
-        module: SuiString,
-        function: SuiString,
-        type_arguments: SuiArray[SuiString],
-        arguments: SuiArray[SuiString],
-        gas: ObjectID,
-        gas_budget: SuiInteger,
-    ) -> SuiRpcResult:
-        """move_call_txn invokes `sui_moveCall` API.
-
-        :param signer: Transaction signer
-        :type signer: SuiAddress
-        :param package_object_id: the Move package ID
-        :type package_object_id: ObjectID
-        :param module: The Sui Move module name.
-        :type module: SuiString
-        :param function: The Sui Move function name
-        :type function: SuiString
-        :param type_arguments: The type arguments, if any, of the Sui Move function
-        :type type_arguments: SuiArray[SuiString]
-        :param arguments: The arguments to be passed into the Sui Move function
-        :type arguments: SuiArray[SuiString]
-        :param gas: gas object to be used in this transaction
-        :type gas: ObjectID
-        :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
-        :type gas_budget: SuiInteger
-        :return: Result of the transaction
-        :rtype: SuiRpcResult
-        """
-        logger.warning("using deprecated method: move_call_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(MoveCall(**inargs))
-
-    @deprecated(version="0.28.0", reason="Use SuiTransaction builder instead.")
-    def publish_package_txn(
-        self,
-        sender: SuiAddress,
-        compiled_modules: SuiArray[SuiString],
-        dependencies: SuiArray[ObjectID],
-        gas: ObjectID,
-        gas_budget: SuiInteger,
-    ) -> SuiRpcResult:
-        """publish_package_txn invokes `sui_publish` API.
-
-        :param sender: the transaction signer's Sui address
-        :type sender: SuiAddress
-        :param compiled_modules: the compiled bytes of a sui move package
-        :type compiled_modules: SuiArray[SuiString]
-        :param gas: gas object to be used in this transaction
-        :type gas: ObjectID
-        :param gas_budget: the gas budget, the transaction will fail if the gas cost exceed the budget
-        :type gas_budget: SuiInteger
-        :return: Result of the transaction
-        :rtype: SuiRpcResult
-        """
-        logger.warning("using deprecated method: publish_package_txn")
-        inargs: dict = locals().copy()
-        inargs.pop("self")
-        return self.execute(Publish(**inargs))
+        _warn_deprecated(logger, "split_coin_txn")
+        return self.execute(
+            SplitCoin(
+                signer=signer,
+                coin_object_id=coin_object_id,
+                split_amounts=split_amounts,
+                gas=gas,
+                gas_budget=gas_budget,
+            )
+        )
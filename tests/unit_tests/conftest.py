@@ -0,0 +1,150 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Fixtures for offline client tests against an httpx.MockTransport."""
+
+import json
+import os
+from typing import Any, Callable, Union
+
+import httpx
+import pytest
+
+from pysui.sui.sui_apidesc import SuiApi, SuiApiParam, SuiApiResult, SuiJsonArray, SuiJsonString
+from pysui.sui.sui_builders.base_builder import SuiBaseBuilder
+from pysui.sui.sui_clients import async_client, sync_client
+from pysui.sui.sui_clients.common import _ClientMixin
+from pysui.sui.sui_config import SuiConfig
+from pysui.sui.sui_constants import PYSUI_RPC_VERSION
+from pysui.sui.sui_crypto import create_new_keypair
+
+RPC_URL: str = "http://localhost:9000"
+RPC_VERSION: str = "1.5.0"
+
+
+def _api_for(builder: SuiBaseBuilder) -> SuiApi:
+    """Describe builder's RPC method from its parameters, in order."""
+    params = []
+    for name, value in builder.params.items():
+        if hasattr(value, "array") or isinstance(value, list):
+            schema = SuiJsonArray(type="array", type_path=["array"], items=SuiJsonString("string", []))
+        else:
+            schema = SuiJsonString(type="string", type_path=["string"])
+        params.append(SuiApiParam(name=name, schema=schema))
+    return SuiApi(name=builder.method, params=params, result=SuiApiResult(name="result", schema={}))
+
+
+class MockRpc:
+    """Stand in Sui JSON-RPC node serving single and batch requests.
+
+    A method's reply is taken from `errors` (JSON-RPC error object) or `results`, which holds
+    either the result or a callable taking the request params and returning it. Unknown
+    methods reply with an empty object.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no canned replies."""
+        self.results: dict[str, Any] = {}
+        self.errors: dict[str, dict] = {}
+        self.posts: list[Union[dict, list]] = []
+
+    @property
+    def methods(self) -> list[Union[str, list[str]]]:
+        """Methods of each HTTP post, a list for batch posts."""
+        return [[x["method"] for x in post] if isinstance(post, list) else post["method"] for post in self.posts]
+
+    def _reply(self, request: dict) -> dict:
+        """Reply to one JSON-RPC request."""
+        method = request["method"]
+        if method in self.errors:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": self.errors[method]}
+        result = self.results.get(method, {})
+        if callable(result):
+            result = result(request["params"])
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """httpx.MockTransport handler."""
+        body = json.loads(request.content)
+        self.posts.append(body)
+        if isinstance(body, list):
+            return httpx.Response(200, json=[self._reply(x) for x in body])
+        return httpx.Response(200, json=self._reply(body))
+
+
+@pytest.fixture
+def offline(monkeypatch) -> None:
+    """Remove the clients' descriptor fetches and describe RPC methods from the builders used."""
+
+    def _fetch_rpc_api(self) -> None:
+        self._rpc_version = RPC_VERSION
+        self._rpc_api = {}
+        os.environ[PYSUI_RPC_VERSION] = RPC_VERSION
+
+    def _fetch_common_descriptors(self) -> None:
+        self._gas_price = "1000"
+
+    real_validate = _ClientMixin._validate_builder
+
+    def _validate_builder(self, builder: SuiBaseBuilder) -> dict:
+        if builder.method not in self._rpc_api:
+            self._rpc_api[builder.method] = _api_for(builder)
+        return real_validate(self, builder)
+
+    monkeypatch.setattr(_ClientMixin, "_fetch_rpc_api", _fetch_rpc_api)
+    monkeypatch.setattr(_ClientMixin, "_fetch_common_descriptors", _fetch_common_descriptors)
+    monkeypatch.setattr(_ClientMixin, "_validate_builder", _validate_builder)
+
+
+@pytest.fixture
+def mock_rpc() -> MockRpc:
+    """Fixture for the stand in node."""
+    return MockRpc()
+
+
+@pytest.fixture
+def sui_config() -> SuiConfig:
+    """Configuration with a single ED25519 keypair."""
+    keypair = create_new_keypair()[1]
+    return SuiConfig.user_config(rpc_url=RPC_URL, prv_keys=[keypair.serialize()])
+
+
+@pytest.fixture
+def sync_client_for(offline, mock_rpc: MockRpc, sui_config: SuiConfig) -> Callable[..., sync_client.SuiClient]:
+    """Fixture making synchronous clients that post to mock_rpc."""
+    clients = []
+
+    def _make(**kwargs) -> sync_client.SuiClient:
+        client = sync_client.SuiClient(sui_config, **kwargs)
+        client._client.close()
+        client._client = httpx.Client(transport=httpx.MockTransport(mock_rpc.handler))
+        client._ensure_descriptors()
+        clients.append(client)
+        return client
+
+    yield _make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def async_client_for(offline, mock_rpc: MockRpc, sui_config: SuiConfig) -> Callable[..., async_client.SuiClient]:
+    """Fixture making asynchronous clients that post to mock_rpc."""
+
+    def _make(**kwargs) -> async_client.SuiClient:
+        client = async_client.SuiClient(sui_config, **kwargs)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(mock_rpc.handler))
+        client._ensure_descriptors()
+        return client
+
+    return _make
@@ -0,0 +1,129 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing synchronous client batch_window_ms request coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pysui.sui.sui_builders.get_builders import GetReferenceGasPrice
+
+WINDOW_MS: float = 50.0
+
+
+def _blocking(release: threading.Event):
+    """Reply to the first request once released, to others at once."""
+    calls = []
+
+    def _reply(_params) -> str:
+        calls.append(None)
+        if len(calls) == 1:
+            release.wait(5)
+        return "1000"
+
+    return _reply
+
+
+def _wait_queued(client, count: int) -> None:
+    """Wait for count requests to be queued behind the one in flight."""
+    deadline = time.monotonic() + 5
+    while len(client._dispatcher._pending) < count:
+        assert time.monotonic() < deadline, "requests were not queued"
+        time.sleep(0.001)
+
+
+def test_single_caller_not_delayed(sync_client_for, mock_rpc) -> None:
+    """With nothing else queued or in flight requests are sent at once, on their own."""
+    client = sync_client_for(batch_window_ms=10_000)
+    start = time.monotonic()
+    assert client.execute(GetReferenceGasPrice()).is_ok()
+    assert client.execute(GetReferenceGasPrice()).is_ok()
+    assert time.monotonic() - start < 5
+    assert mock_rpc.methods == ["suix_getReferenceGasPrice"] * 2
+
+
+def test_concurrent_requests_coalesced(sync_client_for, mock_rpc) -> None:
+    """Requests made while one is in flight are sent in one batch when the window expires."""
+    release = threading.Event()
+    mock_rpc.results["suix_getReferenceGasPrice"] = _blocking(release)
+    client = sync_client_for(batch_window_ms=WINDOW_MS)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(client.execute, GetReferenceGasPrice())
+        while not mock_rpc.posts:
+            time.sleep(0.001)
+        others = [pool.submit(client.execute, GetReferenceGasPrice()) for _ in range(2)]
+        _wait_queued(client, 2)
+        release.set()
+        results = [first.result(5)] + [future.result(5) for future in others]
+    assert [result.result_data for result in results] == ["1000"] * 3
+    assert mock_rpc.methods == ["suix_getReferenceGasPrice", ["suix_getReferenceGasPrice"] * 2]
+
+
+def test_full_batch_sent_before_window(sync_client_for, mock_rpc) -> None:
+    """A queue reaching the batch size is sent without waiting for the window."""
+    release = threading.Event()
+    mock_rpc.results["suix_getReferenceGasPrice"] = _blocking(release)
+    client = sync_client_for(batch_window_ms=60_000)
+    client._dispatcher._max_batch = 2
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(client.execute, GetReferenceGasPrice())
+        while not mock_rpc.posts:
+            time.sleep(0.001)
+        others = [pool.submit(client.execute, GetReferenceGasPrice()) for _ in range(2)]
+        for future in others:
+            assert future.result(5).is_ok()
+        release.set()
+        assert first.result(5).is_ok()
+    assert mock_rpc.methods[1] == ["suix_getReferenceGasPrice"] * 2
+
+
+def test_transport_error_per_caller(sync_client_for) -> None:
+    """A failed request is an error result for each of its callers."""
+    client = sync_client_for(batch_window_ms=WINDOW_MS)
+
+    def _refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client._client = httpx.Client(transport=httpx.MockTransport(_refuse))
+    result = client.execute(GetReferenceGasPrice())
+    assert result.is_err()
+    assert result.result_string == "HTTPX error: ConnectError"
+
+
+def test_exception_raised_to_callers(sync_client_for, mock_rpc, monkeypatch) -> None:
+    """An exception sending a batch is raised to every caller in it."""
+    release = threading.Event()
+    mock_rpc.results["suix_getReferenceGasPrice"] = _blocking(release)
+    client = sync_client_for(batch_window_ms=WINDOW_MS)
+
+    def _fail(_builders):
+        raise RuntimeError("batch failed")
+
+    monkeypatch.setattr(client, "_execute_batch", _fail)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        first = pool.submit(client.execute, GetReferenceGasPrice())
+        while not mock_rpc.posts:
+            time.sleep(0.001)
+        others = [pool.submit(client.execute, GetReferenceGasPrice()) for _ in range(2)]
+        _wait_queued(client, 2)
+        release.set()
+        assert first.result(5).is_ok()
+        for future in others:
+            with pytest.raises(RuntimeError, match="batch failed"):
+                future.result(5)
+    # The dispatcher recovers for later requests
+    assert client.execute(GetReferenceGasPrice()).is_ok()
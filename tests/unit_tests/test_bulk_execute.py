@@ -0,0 +1,228 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing synchronous client bulk_execute composition of legacy builders."""
+
+import base64
+
+import pytest
+
+from pysui.sui.sui_builders.exec_builders import MoveCall, Publish, SplitCoinEqually, TransferSui
+from pysui.sui.sui_clients.transaction import SuiTransaction
+from pysui.sui.sui_types.collections import SuiArray
+from pysui.sui.sui_types.scalars import ObjectID, SuiString, SuiU64
+
+COIN: str = "0x" + "c" * 64
+USDC: str = "0x" + "a" * 64 + "::usdc::USDC"
+# 0x2::pay::split<T>(coin: &mut Coin<T>, split_amount: u64, ctx: &mut TxContext)
+PAY_SPLIT: dict = {
+    "visibility": "Public",
+    "isEntry": True,
+    "typeParameters": [{"abilities": []}],
+    "parameters": [
+        {"MutableReference": {"Struct": {"address": "0x2", "module": "coin", "name": "Coin", "typeArguments": [{"TypeParameter": 0}]}}},
+        "U64",
+        {"MutableReference": {"Struct": {"address": "0x2", "module": "tx_context", "name": "TxContext", "typeArguments": []}}},
+    ],
+    "return": [],
+}
+
+
+STRING: dict = {"Struct": {"address": "0x1", "module": "string", "name": "String", "typeArguments": []}}
+OBJECT_ID: dict = {"Struct": {"address": "0x2", "module": "object", "name": "ID", "typeArguments": []}}
+USDC_COIN: dict = {
+    "Struct": {"address": "0x2", "module": "coin", "name": "Coin", "typeArguments": [{"TypeParameter": 0}]}
+}
+
+
+def _function(*parameters) -> dict:
+    """Reply to sui_getNormalizedMoveFunction for a function of parameters."""
+    return {"visibility": "Public", "isEntry": True, "typeParameters": [{"abilities": []}], "parameters": list(parameters)}
+
+
+def _move_call(client, arguments: list, type_arguments: tuple = (USDC,)) -> MoveCall:
+    """MoveCall builder for 0x2::test::call with arguments."""
+    return MoveCall(
+        signer=client.config.active_address,
+        package_object_id=ObjectID("0x2"),
+        module=SuiString("test"),
+        function=SuiString("call"),
+        type_arguments=SuiArray([SuiString(x) for x in type_arguments]),
+        arguments=SuiArray(arguments),
+        gas=ObjectID(COIN),
+        gas_budget=SuiString("1000"),
+    )
+
+
+def _coins(params: dict) -> list[dict]:
+    """Reply to sui_multiGetObjects with USDC coins owned by nobody in particular."""
+    return [
+        {
+            "data": {
+                "objectId": object_id,
+                "version": "7",
+                "digest": "1" * 32,
+                "type": f"0x2::coin::Coin<{USDC}>",
+                "owner": {"AddressOwner": "0x" + "b" * 64},
+            }
+        }
+        for object_id in params["object_ids"]
+    ]
+
+
+@pytest.fixture
+def composed(monkeypatch) -> list:
+    """Capture the transaction bulk_execute would execute."""
+    transactions = []
+
+    def _execute(txn, *, gas_budget):
+        transactions.append((txn, gas_budget))
+        return "executed"
+
+    monkeypatch.setattr(SuiTransaction, "execute", _execute)
+    monkeypatch.setattr(SuiTransaction, "_MC_RESULT_CACHE", {})
+    return transactions
+
+
+def _pure_inputs(txn: SuiTransaction) -> list[list[int]]:
+    """Values of the transaction's pure inputs."""
+    return [key.value for key in txn.builder.inputs if key.enum_name == "Pure"]
+
+
+def test_move_call_with_type_arguments(sync_client_for, mock_rpc, composed) -> None:
+    """Type arguments are type tags, arguments are objects or pure by the function's parameters."""
+    mock_rpc.results["sui_getNormalizedMoveFunction"] = PAY_SPLIT
+    mock_rpc.results["sui_multiGetObjects"] = _coins
+    client = sync_client_for()
+    builder = MoveCall(
+        signer=client.config.active_address,
+        package_object_id=ObjectID("0x2"),
+        module=SuiString("pay"),
+        function=SuiString("split"),
+        type_arguments=SuiArray([SuiString(USDC)]),
+        arguments=SuiArray([SuiString(COIN), SuiString("5")]),
+        gas=ObjectID(COIN),
+        gas_budget=SuiString("2000"),
+    )
+    assert client.bulk_execute([builder]) == "executed"
+    txn, gas_budget = composed[0]
+    assert gas_budget == "2000"
+    command = txn.builder.commands[0].value
+    assert command.Type_Arguments[0].value.name == "USDC"
+    assert _pure_inputs(txn) == [list(SuiU64(5).to_bytes())]
+    assert [key.enum_name for key in txn.builder.inputs] == ["Object", "Pure"]
+
+
+def test_split_uses_coin_type(sync_client_for, mock_rpc, composed) -> None:
+    """A non-SUI coin is split with its own coin type."""
+    mock_rpc.results["sui_multiGetObjects"] = _coins
+    # pay::divide_and_keep has the same signature as pay::split
+    mock_rpc.results["sui_getNormalizedMoveFunction"] = PAY_SPLIT
+    client = sync_client_for()
+    builder = SplitCoinEqually(
+        signer=client.config.active_address,
+        coin_object_id=ObjectID(COIN),
+        split_count=SuiString("3"),
+        gas=ObjectID(COIN),
+        gas_budget=SuiString("1000"),
+    )
+    client.bulk_execute([builder])
+    txn, _ = composed[0]
+    assert txn.builder.commands[0].value.Type_Arguments[0].value.name == "USDC"
+    assert mock_rpc.methods.count("sui_multiGetObjects") == 1
+
+
+def test_rejects_empty_and_unsupported(sync_client_for, mock_rpc, composed) -> None:
+    """Unsupported builders and empty lists are rejected before anything is sent."""
+    client = sync_client_for()
+    signer = client.config.active_address
+    transfer = TransferSui(
+        signer=signer,
+        sui_object_id=ObjectID(COIN),
+        gas_budget=SuiString("1000"),
+        recipient=signer,
+        amount=SuiString("1"),
+    )
+    with pytest.raises(ValueError, match="at least one builder"):
+        client.bulk_execute([])
+    with pytest.raises(ValueError, match="does not support TransferSui"):
+        client.bulk_execute([transfer])
+    assert not mock_rpc.posts and not composed
+
+
+def test_struct_arguments(sync_client_for, mock_rpc, composed) -> None:
+    """String and ID structs are pure, other structs by value are objects."""
+    mock_rpc.results["sui_getNormalizedMoveFunction"] = _function(STRING, OBJECT_ID, USDC_COIN)
+    mock_rpc.results["sui_multiGetObjects"] = _coins
+    client = sync_client_for()
+    client.bulk_execute([_move_call(client, [SuiString("hello"), SuiString("0x5"), SuiString(COIN)])])
+    txn, _ = composed[0]
+    assert [key.enum_name for key in txn.builder.inputs] == ["Pure", "Pure", "Object"]
+    assert _pure_inputs(txn) == [[5, *b"hello"], [0] * 31 + [5]]
+
+
+def test_vector_arguments(sync_client_for, mock_rpc, composed) -> None:
+    """Vectors of strings are pure, vectors of objects are made from the objects, also when empty."""
+    mock_rpc.results["sui_getNormalizedMoveFunction"] = _function(
+        {"Vector": STRING}, {"Vector": USDC_COIN}, {"Vector": USDC_COIN}, {"Vector": "U8"}
+    )
+    mock_rpc.results["sui_multiGetObjects"] = _coins
+    client = sync_client_for()
+    client.bulk_execute([_move_call(client, [["hello", "world"], [COIN], [], SuiString("hi")])])
+    txn, _ = composed[0]
+    commands = [command.enum_name for command in txn.builder.commands]
+    assert commands == ["MakeMoveVec", "MakeMoveVec", "MoveCall"]
+    assert txn.builder.commands[1].value.Vector == []
+    assert txn.builder.commands[1].value.TypeTag.value.value.type_parameters[0].value.name == "USDC"
+    assert _pure_inputs(txn) == [[2, 5, *b"hello", 5, *b"world"], [2, *b"hi"]]
+
+
+def test_publish(sync_client_for, composed) -> None:
+    """Publish becomes a publish command whose upgrade capability is transferred to the sender."""
+    client = sync_client_for()
+    builder = Publish(
+        sender=client.config.active_address,
+        compiled_modules=SuiArray([SuiString(base64.b64encode(b"module").decode())]),
+        dependencies=SuiArray([ObjectID("0x1"), ObjectID("0x2")]),
+        gas=ObjectID(COIN),
+        gas_budget=SuiString("3000"),
+    )
+    client.bulk_execute([builder])
+    txn, gas_budget = composed[0]
+    assert gas_budget == "3000"
+    publish, transfer = txn.builder.commands
+    assert publish.enum_name == "Publish" and transfer.enum_name == "TransferObjects"
+    assert publish.value.Modules == [list(b"module")]
+    assert len(publish.value.Dependents) == 2
+
+
+def test_split_rejects_non_coin(sync_client_for, mock_rpc, composed) -> None:
+    """Splitting an object that is not a coin is a clear error."""
+
+    def _not_coin(params: dict) -> list[dict]:
+        objects = _coins(params)
+        objects[0]["data"]["type"] = "0x2::kiosk::Kiosk"
+        return objects
+
+    mock_rpc.results["sui_multiGetObjects"] = _not_coin
+    client = sync_client_for()
+    builder = SplitCoinEqually(
+        signer=client.config.active_address,
+        coin_object_id=ObjectID(COIN),
+        split_count=SuiString("3"),
+        gas=ObjectID(COIN),
+        gas_budget=SuiString("1000"),
+    )
+    with pytest.raises(ValueError, match="is not a coin, found type 0x2::kiosk::Kiosk"):
+        client.bulk_execute([builder])
+    assert not composed
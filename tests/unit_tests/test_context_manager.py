@@ -0,0 +1,46 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing clients used as context managers."""
+
+import asyncio
+
+import pytest
+
+from pysui.sui.sui_builders.get_builders import GetReferenceGasPrice
+
+
+def test_sync_context_closes(sync_client_for, mock_rpc) -> None:
+    """Leaving the context closes the connections, also on error."""
+    mock_rpc.results["suix_getReferenceGasPrice"] = "1000"
+    with sync_client_for() as client:
+        assert client.execute(GetReferenceGasPrice()).is_ok()
+    assert client._client.is_closed
+    with pytest.raises(RuntimeError):
+        with sync_client_for() as failing:
+            raise RuntimeError("in context")
+    assert failing._client.is_closed
+
+
+def test_async_context_closes(async_client_for, mock_rpc) -> None:
+    """Leaving the async context closes the connections."""
+    mock_rpc.results["suix_getReferenceGasPrice"] = "1000"
+
+    async def _run():
+        async with async_client_for() as client:
+            result = await client.execute(GetReferenceGasPrice())
+        return client, result
+
+    client, result = asyncio.run(_run())
+    assert result.is_ok()
+    assert client._client.is_closed
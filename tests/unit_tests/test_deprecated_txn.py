@@ -0,0 +1,56 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing synchronous client deprecated transaction methods."""
+
+import base64
+
+import pytest
+
+from pysui.sui.sui_clients._deprecated_sync import DeprecatedTxnMixin
+from pysui.sui.sui_clients.sync_client import SuiClient
+from pysui.sui.sui_types.scalars import ObjectID, SuiString
+
+DEPRECATED: tuple[str, ...] = ("split_coin_equally_txn", "move_call_txn", "publish_package_txn")
+
+
+def test_methods_inherited() -> None:
+    """The deprecated methods come from the mixin and are visible on the class."""
+    assert issubclass(SuiClient, DeprecatedTxnMixin)
+    for name in DEPRECATED:
+        assert name in dir(SuiClient)
+        assert name not in SuiClient.__dict__ and name in DeprecatedTxnMixin.__dict__
+
+
+def test_unknown_attribute_raises(sync_client_for) -> None:
+    """Missing attributes raise AttributeError naturally."""
+    client = sync_client_for()
+    with pytest.raises(AttributeError, match="no_such_method"):
+        client.no_such_method  # pylint: disable=pointless-statement
+
+
+def test_split_coin_equally_txn_executes(sync_client_for, mock_rpc) -> None:
+    """A deprecated method builds its legacy builder and signs and executes it."""
+    mock_rpc.results["unsafe_splitCoinEqual"] = {"txBytes": base64.b64encode(b"tx").decode(), "gas": []}
+    mock_rpc.results["sui_executeTransactionBlock"] = {"digest": "D"}
+    client = sync_client_for()
+    with pytest.warns(DeprecationWarning):
+        result = client.split_coin_equally_txn(
+            signer=client.config.active_address,
+            coin_object_id=ObjectID("0x10"),
+            split_count=SuiString("2"),
+            gas=ObjectID("0x11"),
+            gas_budget=SuiString("1000"),
+        )
+    assert result.is_ok()
+    assert mock_rpc.methods == ["unsafe_splitCoinEqual", "sui_executeTransactionBlock"]
@@ -0,0 +1,157 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing client execute_batch."""
+
+import asyncio
+import base64
+
+from pysui.sui.sui_builders.exec_builders import TransferSui
+from pysui.sui.sui_builders.get_builders import GetReferenceGasPrice
+from pysui.sui.sui_clients.common import _owned_objects
+from pysui.sui.sui_txresults.complex_tx import TxResponse
+from pysui.sui.sui_types.address import SuiAddress
+from pysui.sui.sui_types.scalars import ObjectID, SuiString
+
+TX_BYTES: str = base64.b64encode(b"tx bytes").decode()
+
+
+def _transfer_sui(params: dict) -> dict:
+    """Reply to unsafe_transferSui, the coin transferred is also the gas."""
+    return {"txBytes": TX_BYTES, "gas": [{"objectId": params["sui_object_id"]}], "inputObjects": []}
+
+
+def _transfer(signer: SuiAddress, coin: str, amount: str = "1") -> TransferSui:
+    """Transfer builder sending amount of coin to signer."""
+    return TransferSui(
+        signer=signer,
+        sui_object_id=ObjectID(coin),
+        gas_budget=SuiString("1000"),
+        recipient=signer,
+        amount=SuiString(amount),
+    )
+
+
+def test_batches_independent_builders(sync_client_for, mock_rpc) -> None:
+    """Submissions share one batch request and executions a second."""
+    mock_rpc.results["suix_getReferenceGasPrice"] = "1000"
+    mock_rpc.results["unsafe_transferSui"] = _transfer_sui
+    mock_rpc.results["sui_executeTransactionBlock"] = {"digest": "D"}
+    client = sync_client_for()
+    signer = client.config.active_address
+    results = client.execute_batch([GetReferenceGasPrice(), _transfer(signer, "0x10"), _transfer(signer, "0x11")])
+    assert mock_rpc.methods == [
+        ["suix_getReferenceGasPrice", "unsafe_transferSui", "unsafe_transferSui"],
+        ["sui_executeTransactionBlock", "sui_executeTransactionBlock"],
+    ]
+    assert [result.is_ok() for result in results] == [True, True, True]
+    assert results[0].result_data == "1000"
+    assert isinstance(results[1].result_data, TxResponse)
+
+
+def test_shared_gas_executed_after_batch(sync_client_for, mock_rpc) -> None:
+    """A transaction using the gas of an earlier one is executed on its own afterwards."""
+    mock_rpc.results["unsafe_transferSui"] = _transfer_sui
+    mock_rpc.results["sui_executeTransactionBlock"] = {"digest": "D"}
+    client = sync_client_for()
+    signer = client.config.active_address
+    results = client.execute_batch([_transfer(signer, "0x10"), _transfer(signer, "0x10"), _transfer(signer, "0x11")])
+    assert mock_rpc.methods == [
+        ["unsafe_transferSui"] * 3,
+        ["sui_executeTransactionBlock"] * 2,
+        "unsafe_transferSui",
+        "sui_executeTransactionBlock",
+    ]
+    assert all(result.is_ok() for result in results)
+
+
+def test_signing_failure_is_per_builder(sync_client_for, mock_rpc) -> None:
+    """A transaction that can not be signed fails alone, the others are executed."""
+    mock_rpc.results["unsafe_transferSui"] = _transfer_sui
+    mock_rpc.results["sui_executeTransactionBlock"] = {"digest": "D"}
+    client = sync_client_for()
+    signer = client.config.active_address
+    stranger = SuiAddress("0x" + "7" * 64)
+    results = client.execute_batch([_transfer(signer, "0x10"), _transfer(stranger, "0x11")])
+    assert results[0].is_ok()
+    assert results[1].is_err()
+    assert results[1].result_data["type"] == "ValueError"
+    assert mock_rpc.methods[-1] == ["sui_executeTransactionBlock"]
+
+
+def test_submission_error(sync_client_for, mock_rpc) -> None:
+    """A JSON-RPC error for a submission is that builder's result."""
+    mock_rpc.errors["unsafe_transferSui"] = {"code": -1, "message": "no coin"}
+    client = sync_client_for()
+    signer = client.config.active_address
+    results = client.execute_batch([GetReferenceGasPrice(), _transfer(signer, "0x10")])
+    assert results[0].is_ok()
+    assert results[1].is_err() and results[1].result_string == "no coin"
+    assert len(mock_rpc.posts) == 1
+
+
+def test_empty_batch(sync_client_for, mock_rpc) -> None:
+    """No builders, no requests."""
+    assert sync_client_for().execute_batch([]) == []
+    assert not mock_rpc.posts
+
+
+def test_async_execute_batch(async_client_for, mock_rpc) -> None:
+    """The asynchronous client defers conflicting transactions and reports failures per builder."""
+    mock_rpc.results["suix_getReferenceGasPrice"] = "1000"
+    mock_rpc.results["unsafe_transferSui"] = _transfer_sui
+    mock_rpc.results["sui_executeTransactionBlock"] = {"digest": "D"}
+    client = async_client_for()
+    signer = client.config.active_address
+    stranger = SuiAddress("0x" + "7" * 64)
+    builders = [
+        GetReferenceGasPrice(),
+        _transfer(signer, "0x10"),
+        _transfer(signer, "0x10"),
+        _transfer(stranger, "0x12"),
+    ]
+
+    async def _run():
+        results = await client.execute_batch(builders)
+        await client.close()
+        return results
+
+    results = asyncio.run(_run())
+    assert [result.is_ok() for result in results] == [True, True, True, False]
+    # 4 submissions, 1 batched execution then the deferred transfer on its own
+    assert mock_rpc.methods[4:] == ["sui_executeTransactionBlock", "unsafe_transferSui", "sui_executeTransactionBlock"]
+
+
+def test_owned_objects() -> None:
+    """Gas and owned inputs conflict, shared objects and packages do not."""
+    tx_bytes = {
+        "gas": [{"objectId": "0x1"}],
+        "inputObjects": [
+            {"ImmOrOwnedMoveObject": {"objectId": "0x2"}},
+            {"SharedMoveObject": {"objectId": "0x6", "initialSharedVersion": 1, "mutable": True}},
+            {"MovePackage": "0x3"},
+        ],
+    }
+    assert _owned_objects(tx_bytes) == {"0x1", "0x2"}
+
+
+def test_batches_limited(sync_client_for, mock_rpc) -> None:
+    """Batch requests carry at most _RPC_BATCH_LIMIT requests, results keep the builders' order."""
+    mock_rpc.results["unsafe_transferSui"] = _transfer_sui
+    mock_rpc.results["sui_executeTransactionBlock"] = {"digest": "D"}
+    client = sync_client_for()
+    signer = client.config.active_address
+    builders = [_transfer(signer, hex(0x100 + index)) for index in range(client._RPC_BATCH_LIMIT + 10)]
+    results = client.execute_batch(builders)
+    assert [len(post) for post in mock_rpc.posts] == [50, 10, 50, 10]
+    assert len(results) == 60 and all(result.is_ok() for result in results)
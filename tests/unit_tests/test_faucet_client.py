@@ -0,0 +1,31 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the synchronous client's faucet connection."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_faucet_client_created_once(sync_client_for) -> None:
+    """Concurrent first callers share one faucet client."""
+    client = sync_client_for()
+    barrier = threading.Barrier(8)
+
+    def _get():
+        barrier.wait()
+        return client._get_faucet_client()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        faucet_clients = list(pool.map(lambda _: _get(), range(8)))
+    assert len({id(faucet_client) for faucet_client in faucet_clients}) == 1
@@ -0,0 +1,60 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing synchronous client get_objects_for on large identifier lists."""
+
+import httpx
+
+from pysui.sui.sui_types.scalars import ObjectID
+
+
+def _objects(params: dict) -> list[dict]:
+    """Reply to sui_multiGetObjects."""
+    return [{"data": {"objectId": object_id, "version": "1", "digest": "d"}} for object_id in params["object_ids"]]
+
+
+def _identifiers(count: int) -> list[ObjectID]:
+    """Distinct object identifiers."""
+    return [ObjectID(hex(0x1000 + index)) for index in range(count)]
+
+
+def test_chunks_batched_within_limit(sync_client_for, mock_rpc) -> None:
+    """Chunks are sent in batch requests of at most _RPC_BATCH_LIMIT requests."""
+    mock_rpc.results["sui_multiGetObjects"] = _objects
+    client = sync_client_for()
+    identifiers = _identifiers(client.max_gets * (client._RPC_BATCH_LIMIT + 10))
+    result = client.get_objects_for(identifiers)
+    assert result.is_ok()
+    assert [item.object_id for item in result.result_data] == [str(x) for x in identifiers]
+    assert [len(post) for post in mock_rpc.posts] == [50, 10]
+
+
+def test_failed_chunk_is_result(sync_client_for, mock_rpc) -> None:
+    """A failed chunk is returned as the error result rather than exiting."""
+    mock_rpc.errors["sui_multiGetObjects"] = {"code": -1, "message": "too busy"}
+    client = sync_client_for()
+    result = client.get_objects_for(_identifiers(client.max_gets + 1))
+    assert result.is_err()
+
+
+def test_failed_post_is_result(sync_client_for) -> None:
+    """A failed batch request is returned as the error result rather than exiting."""
+    client = sync_client_for()
+
+    def _refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client._client = httpx.Client(transport=httpx.MockTransport(_refuse))
+    result = client.get_objects_for(_identifiers(client.max_gets + 1))
+    assert result.is_err()
+    assert result.result_string == "HTTPX error: ConnectError"
@@ -0,0 +1,52 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing pysui and pysui.sui package level names imported on first access."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pysui
+import pysui.sui
+from pysui.sui.sui_clients import async_client, sync_client
+
+
+def test_submodule_import_does_not_load_clients() -> None:
+    """Importing a submodule leaves the clients, crypto and config unloaded."""
+    script = (
+        "import sys\n"
+        "import pysui.sui.sui_types.scalars\n"
+        "loaded = [m for m in ('pysui.sui.sui_clients.sync_client', 'pysui.sui.sui_crypto', 'pysui.sui.sui_config')"
+        " if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_names_resolved_on_access() -> None:
+    """Package names resolve to the module's object."""
+    assert pysui.SyncClient is sync_client.SuiClient
+    assert pysui.AsyncClient is async_client.SuiClient
+    assert pysui.sui.SuiConfig is pysui.SuiConfig
+    assert {"SyncClient", "AsyncClient", "SuiRpcResult"} <= set(dir(pysui))
+    assert "SuiConfig" in dir(pysui.sui)
+
+
+def test_unknown_name_raises() -> None:
+    """Names not exported raise AttributeError."""
+    with pytest.raises(AttributeError, match="NoSuchName"):
+        pysui.NoSuchName  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError, match="NoSuchName"):
+        pysui.sui.NoSuchName  # pylint: disable=pointless-statement
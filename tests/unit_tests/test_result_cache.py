@@ -0,0 +1,93 @@
+#    Copyright Frank V. Castellucci
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#        http://www.apache.org/licenses/LICENSE-2.0
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+# -*- coding: utf-8 -*-
+
+"""Testing the client cache of immutable package and object version results."""
+
+import asyncio
+
+from pysui.sui.sui_types.scalars import ObjectID, SuiInteger
+from pysui.sui.sui_txresults.single_tx import ObjectRead
+
+PACKAGE = ObjectID("0x2")
+OBJECT = ObjectID("0x" + "5" * 64)
+
+
+def _past_object(params: dict) -> dict:
+    """Reply to sui_tryGetPastObject."""
+    return {
+        "status": "VersionFound",
+        "details": {"objectId": params["object_id"], "version": str(params["version"]), "digest": "d"},
+    }
+
+
+def test_package_cached(sync_client_for, mock_rpc) -> None:
+    """A package is fetched once and each caller gets its own copy."""
+    client = sync_client_for()
+    first = client.get_package(PACKAGE)
+    assert first.is_ok()
+    first.result_data.modules["changed"] = True
+    second = client.get_package(PACKAGE)
+    third = client.get_package(PACKAGE)
+    assert mock_rpc.methods == ["sui_getNormalizedMoveModulesByPackage"]
+    assert "changed" not in second.result_data.modules
+    assert second.result_data is not third.result_data
+
+
+def test_package_error_not_cached(sync_client_for, mock_rpc) -> None:
+    """Failed results are fetched again."""
+    mock_rpc.errors["sui_getNormalizedMoveModulesByPackage"] = {"code": -1, "message": "down"}
+    client = sync_client_for()
+    assert client.get_package(PACKAGE).is_err()
+    assert client.get_package(PACKAGE).is_err()
+    assert len(mock_rpc.posts) == 2
+
+
+def test_object_version_cached(sync_client_for, mock_rpc) -> None:
+    """Versioned objects are cached per version, latest objects are not cached."""
+    mock_rpc.results["sui_tryGetPastObject"] = _past_object
+    mock_rpc.results["sui_getObject"] = {"data": {"objectId": str(OBJECT), "version": "9", "digest": "d"}}
+    client = sync_client_for()
+    for _ in range(2):
+        result = client.get_object(OBJECT, SuiInteger(3))
+        assert isinstance(result.result_data, ObjectRead)
+        assert result.result_data.version == "3"
+    client.get_object(OBJECT, SuiInteger(4))
+    client.get_object(OBJECT)
+    client.get_object(OBJECT)
+    assert mock_rpc.methods == ["sui_tryGetPastObject", "sui_tryGetPastObject", "sui_getObject", "sui_getObject"]
+
+
+def test_cache_evicts_least_recent(sync_client_for, mock_rpc) -> None:
+    """The cache is bounded, least recently used entries are dropped first."""
+    client = sync_client_for()
+    client._IMMUTABLE_CACHE_SIZE = 2
+    for package in ("0x2", "0x3", "0x2", "0x4", "0x2", "0x3"):
+        client.get_package(ObjectID(package))
+    # 0x3 was evicted by 0x4 as 0x2 had been used more recently
+    assert len(mock_rpc.posts) == 4
+
+
+def test_async_package_cached(async_client_for, mock_rpc) -> None:
+    """The asynchronous client shares the cache behavior."""
+    client = async_client_for()
+
+    async def _run():
+        first = await client.get_package(PACKAGE)
+        second = await client.get_package(PACKAGE)
+        await client.close()
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert first.is_ok() and second.is_ok()
+    assert first.result_data is not second.result_data
+    assert len(mock_rpc.posts) == 1